@@ -26,6 +26,10 @@ def hist(num):
     """Collect a number for histogram using the global report."""
     return report.hist(num)
 
+def hist_many(nums):
+    """Collect a batch of numbers for histogram using the global report."""
+    return report.hist_many(nums)
+
 def timeline(event_name):
     """Record a timeline event using the global report."""
     return report.timeline(event_name)
@@ -41,6 +45,7 @@ __all__ = [
     "log",
     "count",
     "hist",
+    "hist_many",
     "timeline",
     "happened",
     "init",
@@ -1,11 +1,13 @@
+import ast
 import inspect
 import os
 import site
 import sys
+import textwrap
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from types import FrameType
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from .autopsy_result import (
     AutopsyResult,
@@ -16,6 +18,43 @@ from .autopsy_result import (
 )
 from .json_utils import to_json_serializable
 
+# Absolute paths of the filenames seen by call_stack(), see _abspath
+_ABSPATH_CACHE: Dict[str, str] = {}
+# Source files read for code context: filename -> (st_mtime_ns, lines, AST)
+_SOURCE_CACHE: Dict[str, Tuple[int, List[str], Optional[ast.Module]]] = {}
+# Code context per line: (filename, line) -> (st_mtime_ns, code context).
+# Traces through the same line share one string instead of each re-reading
+# the file and storing its own copy.
+_CODE_CONTEXT_CACHE: Dict[Tuple[str, int], Tuple[int, str]] = {}
+
+
+def _read_source(
+    filename: str, mtime_ns: int
+) -> Tuple[List[str], Optional[ast.Module]]:
+    """
+    Read and parse a source file, reusing the cached result while it's unchanged.
+
+    Args:
+        filename: Path to the source file
+        mtime_ns: Current modification time of the file in nanoseconds
+
+    Returns:
+        Tuple of (lines, module AST or None if the file doesn't parse)
+    """
+    cached = _SOURCE_CACHE.get(filename)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1], cached[2]
+
+    with open(filename, "r", encoding="utf-8") as f:
+        lines = f.readlines()
+    try:
+        tree: Optional[ast.Module] = ast.parse("".join(lines), filename=filename)
+    except Exception:
+        tree = None
+
+    _SOURCE_CACHE[filename] = (mtime_ns, lines, tree)
+    return lines, tree
+
 
 @dataclass
 class SerializableFrame:
@@ -34,6 +73,33 @@ class StackTrace:
 
     frames: List[SerializableFrame]
     timestamp: float
+    # Built on the first to_json() call; traces aren't modified once captured
+    _json: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def to_json(self) -> Dict[str, Any]:
+        """
+        Convert to the JSON form used in reports and live updates.
+
+        Returns:
+            Dict with "frames" (one dict per frame) and "timestamp"
+        """
+        if self._json is None:
+            self._json = {
+                "frames": [
+                    {
+                        "filename": frame.filename,
+                        "function_name": frame.function_name,
+                        "line_number": frame.line_number,
+                        "code_context": frame.code_context,
+                        "local_variables": frame.local_variables,
+                    }
+                    for frame in self.frames
+                ],
+                "timestamp": self.timestamp,
+            }
+        return self._json
 
 
 class Variable:
@@ -305,6 +371,7 @@ class CallStack:
     _frames: List[inspect.FrameInfo]
     _autopsy_module_path: str
     _captured_trace: Optional[StackTrace]
+    _created_at: float
 
     def __init__(self, frames: List[inspect.FrameInfo], autopsy_module_path: str):
         """
@@ -321,6 +388,8 @@ class CallStack:
         self._frames = frames
         self._autopsy_module_path = autopsy_module_path
         self._captured_trace = None
+        # Traces are timestamped when the stack was observed, not when captured
+        self._created_at = time.time()
 
     @property
     def current(self) -> FrameQuery:
@@ -355,7 +424,7 @@ class CallStack:
         """
         if frame_index < 0 or frame_index >= len(self._frames):
             location = _capture_error_location(
-                self._autopsy_module_path, inspect.stack()
+                self._autopsy_module_path, _current_stack()
             )
             valid_range = (
                 (0, len(self._frames) - 1) if len(self._frames) > 0 else (0, -1)
@@ -562,26 +631,37 @@ class CallStack:
     def _get_line_content(self, filename: str, line_no: int) -> str:
         """Get line content from a file, capturing multi-line calls."""
         try:
-            import textwrap
-            with open(filename, "r", encoding="utf-8") as f:
-                lines = f.readlines()
-                if 0 < line_no <= len(lines):
-                    # Try to detect if this is a multi-line call using AST
-                    end_line = self._find_call_end_line(filename, line_no)
-                    if end_line and end_line > line_no:
-                        # Multi-line call: capture all lines from line_no to end_line
-                        captured_lines = []
-                        for i in range(line_no - 1, min(end_line, len(lines))):
-                            captured_lines.append(lines[i].rstrip("\n\r"))
-                        # Dedent to remove common leading whitespace
-                        dedented = textwrap.dedent("\n".join(captured_lines))
-                        return dedented.strip()
-                    else:
-                        # Single line or AST parsing failed: return just the single line
-                        return lines[line_no - 1].strip()
+            mtime_ns = os.stat(filename).st_mtime_ns
+        except OSError:
+            return ""
+
+        key = (filename, line_no)
+        cached = _CODE_CONTEXT_CACHE.get(key)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        content = ""
+        try:
+            lines, _ = _read_source(filename, mtime_ns)
+            if 0 < line_no <= len(lines):
+                # Try to detect if this is a multi-line call using AST
+                end_line = self._find_call_end_line(filename, line_no)
+                if end_line and end_line > line_no:
+                    # Multi-line call: capture all lines from line_no to end_line
+                    captured_lines = []
+                    for i in range(line_no - 1, min(end_line, len(lines))):
+                        captured_lines.append(lines[i].rstrip("\n\r"))
+                    # Dedent to remove common leading whitespace
+                    dedented = textwrap.dedent("\n".join(captured_lines))
+                    content = dedented.strip()
+                else:
+                    # Single line or AST parsing failed: return just the single line
+                    content = lines[line_no - 1].strip()
         except Exception:
             pass
-        return ""
+
+        _CODE_CONTEXT_CACHE[key] = (mtime_ns, content)
+        return content
 
     def _find_call_end_line(self, filename: str, line_no: int) -> Optional[int]:
         """
@@ -595,11 +675,9 @@ class CallStack:
             Ending line number if found, None otherwise
         """
         try:
-            import ast
-            with open(filename, "r", encoding="utf-8") as f:
-                source_code = f.read()
-
-            tree = ast.parse(source_code, filename=filename)
+            _, tree = _read_source(filename, os.stat(filename).st_mtime_ns)
+            if tree is None:
+                return None
 
             # Walk the AST to find a Call node that spans from line_no
             for node in ast.walk(tree):
@@ -613,13 +691,17 @@ class CallStack:
         except Exception:
             return None
 
-    def _create_serializable_frame(self, frame: FrameType) -> SerializableFrame:
+    def _create_serializable_frame(
+        self, frame: FrameType, include_locals: bool = True
+    ) -> SerializableFrame:
         """Create a serializable frame from a Python frame object."""
         filename = frame.f_code.co_filename
         function_name = frame.f_code.co_name
         line_number = frame.f_lineno
         code_context = self._get_line_content(filename, line_number)
-        local_variables = self._extract_local_variables(frame)
+        local_variables = (
+            self._extract_local_variables(frame) if include_locals else {}
+        )
 
         return SerializableFrame(
             filename=filename,
@@ -702,19 +784,27 @@ class CallStack:
 
         return False
 
-    def _capture_full_stack(self) -> StackTrace:
+    def _capture_full_stack(
+        self, include_locals: bool = True, max_frames: Optional[int] = None
+    ) -> StackTrace:
         """
         Capture the complete stack trace from the current frames.
 
         Includes stdlib frames that are in the middle of the call chain (like map, filter, etc.)
         but stops at entry point frames (like _run_module_as_main) since those represent
         execution infrastructure rather than user code.
+
+        Args:
+            include_locals: Whether to capture each frame's local variables
+            max_frames: Keep at most this many frames, innermost first. None keeps all.
         """
         frames = []
 
         # Walk through all frames in self._frames
         # Include stdlib frames in the middle, but stop at entry point frames
         for frame_info in self._frames:
+            if max_frames is not None and len(frames) >= max_frames:
+                break
             try:
                 frame = frame_info.frame
 
@@ -727,41 +817,98 @@ class CallStack:
                 if self._is_site_packages_frame(frame):
                     continue
 
-                serializable_frame = self._create_serializable_frame(frame)
+                serializable_frame = self._create_serializable_frame(
+                    frame, include_locals
+                )
                 frames.append(serializable_frame)
             except Exception:
                 # Skip problematic frames but continue
                 pass
 
-        return StackTrace(frames=frames, timestamp=time.time())
+        return StackTrace(frames=frames, timestamp=self._created_at)
 
-    def capture_stack_trace(self) -> StackTrace:
+    def capture_stack_trace(
+        self, include_locals: bool = True, max_frames: Optional[int] = None
+    ) -> StackTrace:
         """
         Capture full stack trace lazily.
 
+        Args:
+            include_locals: Whether to capture each frame's local variables.
+                Without them, frames have empty local_variables.
+            max_frames: Keep at most this many frames, innermost first. None keeps all.
+
         Returns:
-            StackTrace object with all frames and variables
+            StackTrace object with all frames and variables. The full trace is
+            captured once and reused; a reduced one is captured on each call.
         """
+        if not include_locals or max_frames is not None:
+            return self._capture_full_stack(include_locals, max_frames)
         if self._captured_trace is None:
             self._captured_trace = self._capture_full_stack()
         return self._captured_trace
 
 
+def _abspath(filename: str) -> str:
+    """
+    Get the absolute path of a code object's filename, cached per filename.
+
+    Args:
+        filename: Filename as stored on the code object
+
+    Returns:
+        The absolute path
+    """
+    path = _ABSPATH_CACHE.get(filename)
+    if path is None:
+        path = _ABSPATH_CACHE[filename] = os.path.abspath(filename)
+    return path
+
+
+def _frame_info(frame: FrameType) -> inspect.FrameInfo:
+    """
+    Describe a frame like inspect.stack() does, without reading its source.
+
+    Args:
+        frame: The frame to describe
+
+    Returns:
+        FrameInfo with no code context
+    """
+    code = frame.f_code
+    return inspect.FrameInfo(
+        frame, code.co_filename, frame.f_lineno, code.co_name, None, None
+    )
+
+
+def _current_stack() -> List[inspect.FrameInfo]:
+    """Get the caller's stack, innermost frame first, like inspect.stack()[1:]."""
+    stack = []
+    frame: Optional[FrameType] = sys._getframe(2)
+    while frame is not None:
+        stack.append(_frame_info(frame))
+        frame = frame.f_back
+    return stack
+
+
 def call_stack() -> CallStack:
     """Create a CallStack instance for the current call site."""
     # Compute the autopsy package path
     autopsy_module_path = os.path.dirname(os.path.abspath(__file__))
 
-    # Capture the current call stack, excluding autopsy's own frames
-    stack = inspect.stack()
-    # Filter out frames from autopsy module
+    # Capture the current call stack, excluding autopsy's own frames. The
+    # frames are walked directly rather than through inspect.stack(), which
+    # looks up the source file and reads code context for every frame.
     frames = []
-    for frame_info in stack:
+    frame: Optional[FrameType] = sys._getframe(1)
+    while frame is not None:
         # Skip frames from autopsy package directory
-        frame_path = os.path.abspath(frame_info.filename)
-        is_autopsy_package = frame_path.startswith(autopsy_module_path)
+        is_autopsy_package = _abspath(frame.f_code.co_filename).startswith(
+            autopsy_module_path
+        )
 
         if not is_autopsy_package:
-            frames.append(frame_info)
+            frames.append(_frame_info(frame))
+        frame = frame.f_back
 
     return CallStack(frames, autopsy_module_path)
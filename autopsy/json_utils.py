@@ -9,7 +9,12 @@ exactly one place.
 import dataclasses
 import json
 import math
-from typing import Any, Union
+from typing import Any, List, Set, Tuple, Union
+
+try:
+    import orjson
+except ImportError:  # Optional fast encoder, see the "fast" extra
+    orjson = None
 
 
 def sanitize_float(value: float) -> Union[float, str]:
@@ -33,12 +38,18 @@ def sanitize_float(value: float) -> Union[float, str]:
     return value
 
 
+# Types that are already JSON-safe as-is. Checked by exact type so that
+# subclasses (e.g. IntEnum) still go through the slower handling below.
+_SCALAR_TYPES = frozenset({int, str, bool, type(None)})
+
+
 def to_json_serializable(value: Any) -> Any:
     """Convert a Python value to a JSON-serializable representation.
 
     Handles special float values (inf, -inf, NaN), recursively processes
     compound types (lists, tuples, dicts), and falls back to a string
-    representation for anything else that json.dumps cannot handle.
+    representation for anything else. Values nested too deeply for a
+    recursive walk, or containing themselves, are converted iteratively.
 
     Args:
         value: Value to convert.
@@ -46,13 +57,32 @@ def to_json_serializable(value: Any) -> Any:
     Returns:
         A JSON-serializable representation of the value.
     """
+    try:
+        return _convert_recursively(value)
+    except RecursionError:
+        return _convert_iteratively(value)
+
+
+def _convert_recursively(value: Any) -> Any:
+    """Convert a value for to_json_serializable, recursing into containers."""
+    value_type = type(value)
+    if value_type in _SCALAR_TYPES:
+        return value
+
     if isinstance(value, float):
         return sanitize_float(value)
 
+    # Scalar items are passed through inline, without a call per item
     if isinstance(value, (list, tuple)):
-        return [to_json_serializable(item) for item in value]
+        return [
+            item if type(item) in _SCALAR_TYPES else _convert_recursively(item)
+            for item in value
+        ]
     elif isinstance(value, dict):
-        return {str(k): to_json_serializable(v) for k, v in value.items()}
+        return {
+            str(k): v if type(v) in _SCALAR_TYPES else _convert_recursively(v)
+            for k, v in value.items()
+        }
 
     if isinstance(value, (int, str, bool, type(None))):
         return value
@@ -61,17 +91,150 @@ def to_json_serializable(value: Any) -> Any:
     if dataclasses.is_dataclass(value) and not isinstance(value, type):
         try:
             # Convert dataclass to dict and recursively process
-            return to_json_serializable(dataclasses.asdict(value))
+            return _convert_recursively(dataclasses.asdict(value))
         except Exception:
             # If conversion fails, fall through to string representation
             pass
 
-    # For other types, test whether json.dumps can handle them directly.
+    return _fallback_repr(value)
+
+
+def _convert_iteratively(value: Any) -> Any:
+    """Convert a value for to_json_serializable, with an explicit stack.
+
+    Slower than _convert_recursively for typical values, so only used when
+    that runs out of stack. A container found inside itself is replaced by a
+    "<type: (circular reference)>" string.
+    """
+    root = [None]
+    # (output container, key, value to convert into it), or (None, id, None)
+    # once a container's items have all been converted
+    stack: List[Tuple[Any, Any, Any]] = [(root, 0, value)]
+    # Containers whose items are being converted, by id
+    active: Set[int] = set()
+
+    while stack:
+        target, key, item = stack.pop()
+        if target is None:
+            active.discard(key)
+            continue
+
+        if type(item) in _SCALAR_TYPES:
+            target[key] = item
+        elif isinstance(item, float):
+            target[key] = sanitize_float(item)
+        elif isinstance(item, (list, tuple, dict)):
+            item_id = id(item)
+            if item_id in active:
+                target[key] = f"<{type(item).__name__}: (circular reference)>"
+                continue
+            active.add(item_id)
+            stack.append((None, item_id, None))
+
+            # Copy the container, then convert its non-scalar items in place.
+            # Pushed in reverse so they're converted in order.
+            if isinstance(item, dict):
+                converted: Any = {str(k): v for k, v in item.items()}
+                items = converted.items()
+            else:
+                converted = list(item)
+                items = enumerate(converted)
+            target[key] = converted
+            for child_key, child in reversed(list(items)):
+                if type(child) not in _SCALAR_TYPES:
+                    stack.append((converted, child_key, child))
+        elif isinstance(item, (int, str, bool)):
+            target[key] = item
+        elif dataclasses.is_dataclass(item) and not isinstance(item, type):
+            try:
+                stack.append((target, key, dataclasses.asdict(item)))
+            except Exception:
+                target[key] = _fallback_repr(item)
+        else:
+            target[key] = _fallback_repr(item)
+
+    return root[0]
+
+
+def _fallback_repr(value: Any) -> str:
+    """String representation for values JSON can't encode."""
+    # json.dumps only encodes the types (and subclasses) handled by the
+    # converters, so there's no need to try it on anything else
     try:
-        json.dumps(value, allow_nan=False)
-        return value
-    except (TypeError, ValueError, OverflowError):
+        return f"<{type(value).__name__}: {repr(value)}>"
+    except Exception:
+        return f"<{type(value).__name__}: (unable to represent)>"
+
+
+def _orjson_option(sort_keys: bool, indent: bool) -> int:
+    """Get the orjson option flags matching dumps()/dumps_bytes() arguments."""
+    option = orjson.OPT_NON_STR_KEYS
+    if sort_keys:
+        option |= orjson.OPT_SORT_KEYS
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    return option
+
+
+def _stdlib_dumps(value: Any, sort_keys: bool, indent: bool) -> str:
+    """Encode with the standard library, formatted like orjson's output."""
+    # Floats should already have been sanitized, so a stray NaN or Infinity
+    # fails here rather than producing JSON the viewer can't parse
+    if indent:
+        return json.dumps(
+            value, indent=2, ensure_ascii=False, sort_keys=sort_keys, allow_nan=False
+        )
+    return json.dumps(
+        value,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        sort_keys=sort_keys,
+        allow_nan=False,
+    )
+
+
+def dumps(value: Any, sort_keys: bool = False, indent: bool = False) -> str:
+    """Encode an already JSON-safe value as a compact JSON string.
+
+    Uses orjson when it is installed, falling back to the standard library
+    encoder otherwise or when orjson rejects the value (e.g. integers wider
+    than 64 bits).
+
+    Args:
+        value: Value to encode, typically the output of to_json_serializable.
+        sort_keys: Whether to sort dict keys, for a canonical encoding.
+        indent: Whether to indent the output by two spaces per level.
+
+    Returns:
+        The JSON text.
+    """
+    if orjson is not None:
         try:
-            return f"<{type(value).__name__}: {repr(value)}>"
-        except Exception:
-            return f"<{type(value).__name__}: (unable to represent)>"
+            return orjson.dumps(value, option=_orjson_option(sort_keys, indent)).decode(
+                "utf-8"
+            )
+        except orjson.JSONEncodeError:
+            pass
+    return _stdlib_dumps(value, sort_keys, indent)
+
+
+def dumps_bytes(value: Any, sort_keys: bool = False, indent: bool = False) -> bytes:
+    """Encode an already JSON-safe value as UTF-8 JSON bytes.
+
+    Like dumps(), but skips decoding orjson's output when the caller needs
+    bytes anyway (e.g. to compress or write them).
+
+    Args:
+        value: Value to encode, typically the output of to_json_serializable.
+        sort_keys: Whether to sort dict keys, for a canonical encoding.
+        indent: Whether to indent the output by two spaces per level.
+
+    Returns:
+        The JSON text, encoded as UTF-8.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, option=_orjson_option(sort_keys, indent))
+        except orjson.JSONEncodeError:
+            pass
+    return _stdlib_dumps(value, sort_keys, indent).encode("utf-8")
@@ -7,13 +7,20 @@ in real-time to connected clients.
 
 import asyncio
 import atexit
+import logging
 import os
-from threading import Thread
-from typing import Set
+import queue
+import time
+from threading import Event, Lock, Thread
+from typing import Callable, List, Optional, Set, Union
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.responses import FileResponse
 
+from autopsy.json_utils import dumps
+
+logger = logging.getLogger(__name__)
+
 app = FastAPI(title="Autopsy Live Server")
 connections: Set[WebSocket] = set()
 
@@ -21,14 +28,33 @@ connections: Set[WebSocket] = set()
 _server_thread = None
 _server = None
 _loop = None
-_logs_transmitted = False  # Track if logs have been sent to a client at least once
+_logs_transmitted = Event()  # Set once logs have been sent to a client at least once
+
+# Upper bound on a single client send; a half-open peer is dropped after this
+_SEND_TIMEOUT = 5.0
+
+# Updates waiting for the sender thread. When it falls behind, the oldest
+# updates are dropped rather than blocking the threads that produce them.
+_BROADCAST_QUEUE_SIZE = 10000
+# Updates sent together in one "batch" message, and how long the sender waits
+# for a batch to fill up before sending what it has
+_BROADCAST_BATCH_SIZE = 100
+_BROADCAST_LINGER = 0.001
+# An update can be queued as a function that builds it (or a list of them),
+# see queue_broadcast
+_Update = Union[dict, Callable[[], Union[None, dict, List[dict]]]]
+_broadcast_queue: "queue.Queue[_Update]" = queue.Queue(maxsize=_BROADCAST_QUEUE_SIZE)
+_sender_thread = None
+# Updates dropped so far, and whether that has been warned about. Guarded by
+# _dropped_updates_lock, as logging threads queue updates concurrently.
+_dropped_updates = 0
+_warned_dropped_updates = False
+_dropped_updates_lock = Lock()
 
 
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     """WebSocket endpoint for streaming autopsy report updates."""
-    global _logs_transmitted
-
     await websocket.accept()
     connections.add(websocket)
 
@@ -39,18 +65,23 @@ async def websocket_endpoint(websocket: WebSocket):
             "type": "snapshot",
             "data": report.to_json()
         }
-        await websocket.send_json(snapshot)
+        await websocket.send_text(dumps(snapshot))
 
         # Mark that logs have been transmitted to at least one client
-        _logs_transmitted = True
+        _logs_transmitted.set()
 
-        # Keep connection alive and listen for messages
+        # Keep the connection open until the client goes away. The client
+        # never sends messages, so wait on raw ASGI events rather than
+        # decoding frames; dead peers are caught by uvicorn's ping/pong.
         while True:
-            await websocket.receive_text()
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
+        connections.discard(websocket)
     except WebSocketDisconnect:
         connections.discard(websocket)
     except Exception as e:
-        print(f"WebSocket error: {e}")
+        logger.debug("WebSocket error: %s", e)
         connections.discard(websocket)
 
 
@@ -58,19 +89,41 @@ async def broadcast_update(update: dict):
     """
     Broadcast an update to all connected clients.
 
+    Sends run concurrently and each is bounded by a timeout, so a stalled
+    client (e.g. a half-open TCP connection) can't block delivery to the
+    others. Clients that time out are closed and dropped.
+
     Args:
         update: Dictionary containing the update to broadcast
     """
-    disconnected = set()
-    for connection in connections:
-        try:
-            await connection.send_json(update)
-        except Exception:
-            disconnected.add(connection)
+    if not connections:
+        return
 
-    # Clean up disconnected clients
-    for conn in disconnected:
-        connections.discard(conn)
+    # Serialize once for all clients
+    payload = dumps(update)
+
+    # Snapshot the set since connections may change while we're awaiting
+    snapshot = list(connections)
+    results = await asyncio.gather(
+        *(
+            asyncio.wait_for(connection.send_text(payload), timeout=_SEND_TIMEOUT)
+            for connection in snapshot
+        ),
+        return_exceptions=True,
+    )
+
+    # Clean up disconnected and stalled clients
+    for connection, result in zip(snapshot, results):
+        if not isinstance(result, BaseException):
+            continue
+        connections.discard(connection)
+        if isinstance(result, asyncio.TimeoutError):
+            try:
+                await asyncio.wait_for(
+                    connection.close(code=1011), timeout=_SEND_TIMEOUT
+                )
+            except Exception:
+                pass
 
 
 # Serve the live mode HTML build
@@ -117,16 +170,18 @@ def start_server(host: str, port: int):
             host=host,
             port=port,
             log_level="warning",
-            loop="asyncio"
+            loop="asyncio",
+            ws_ping_interval=20.0,
+            ws_ping_timeout=20.0,
         )
         server = uvicorn.Server(config)
         _loop.run_until_complete(server.serve())
 
     _server_thread = Thread(target=run_server, daemon=True)
     _server_thread.start()
+    _start_sender()
 
     # Wait a moment for server to start
-    import time
     time.sleep(0.5)
 
     # Register shutdown
@@ -150,21 +205,153 @@ def shutdown_server():
             pass
 
 
-def queue_broadcast(update: dict):
+def _start_sender():
+    """Start the background thread that drains the broadcast queue."""
+    global _sender_thread
+
+    if _sender_thread is None:
+        _sender_thread = Thread(target=_sender_loop, daemon=True)
+        _sender_thread.start()
+
+
+def _next_batch() -> List[_Update]:
+    """
+    Take the next batch of updates off the broadcast queue.
+
+    Blocks until at least one update is available, then collects more until
+    the batch is full or the linger time has passed.
+
+    Returns:
+        List of updates in the order they were queued
+    """
+    batch = [_broadcast_queue.get()]
+    deadline = time.monotonic() + _BROADCAST_LINGER
+    while len(batch) < _BROADCAST_BATCH_SIZE:
+        remaining = deadline - time.monotonic()
+        try:
+            if remaining > 0:
+                batch.append(_broadcast_queue.get(timeout=remaining))
+            else:
+                batch.append(_broadcast_queue.get_nowait())
+        except queue.Empty:
+            break
+    return batch
+
+
+def _build_updates(batch: List[_Update]) -> List[dict]:
+    """
+    Build the updates in a batch that were queued as functions.
+
+    Args:
+        batch: Queued updates
+
+    Returns:
+        The update dicts, leaving out any that couldn't be built and
+        flattening functions that built a list of them
+    """
+    updates = []
+    for update in batch:
+        if callable(update):
+            try:
+                update = update()
+            except Exception as e:
+                logger.debug("Error building update: %s", e)
+                continue
+            if update is None:
+                continue
+            if isinstance(update, list):
+                updates.extend(update)
+                continue
+        updates.append(update)
+    return updates
+
+
+def _sender_loop():
+    """Send queued updates to clients, one batch at a time."""
+    while True:
+        batch = _next_batch()
+        if not (_loop and _loop.is_running()):
+            continue
+
+        updates = _build_updates(batch)
+        # A queued function can build many updates (e.g. for hist_many()), so
+        # messages are still capped at the batch size
+        for start in range(0, len(updates), _BROADCAST_BATCH_SIZE):
+            chunk = updates[start : start + _BROADCAST_BATCH_SIZE]
+            if len(chunk) == 1:
+                message = chunk[0]
+            else:
+                message = {"type": "batch", "updates": chunk}
+
+            # Wait for each batch to go out so updates reach clients in order
+            future = asyncio.run_coroutine_threadsafe(
+                broadcast_update(message), _loop
+            )
+            try:
+                future.result()
+            except Exception as e:
+                logger.debug("Broadcast error: %s", e)
+
+
+def queue_broadcast(update: _Update):
     """
     Queue an update for broadcasting without blocking.
 
-    This is called from the main thread and schedules the broadcast
-    on the server's event loop.
+    This is called from the logging threads; the update is sent to clients
+    by a background sender thread. If the queue is full, the oldest queued
+    update is dropped to make room.
 
     Args:
-        update: Dictionary containing the update to broadcast
+        update: Dictionary containing the update to broadcast, or a function
+            returning it (or a list of updates, or None to skip it).
+            Functions are called on the sender thread, keeping the work of
+            building updates off the logging threads.
+    """
+    global _dropped_updates, _warned_dropped_updates
+
+    if not (_loop and _loop.is_running()):
+        return
+
+    while True:
+        try:
+            _broadcast_queue.put_nowait(update)
+            return
+        except queue.Full:
+            try:
+                _broadcast_queue.get_nowait()
+            except queue.Empty:
+                continue
+            with _dropped_updates_lock:
+                _dropped_updates += 1
+                warn = not _warned_dropped_updates
+                _warned_dropped_updates = True
+            if warn:
+                logger.warning(
+                    "Live mode clients can't keep up; dropping oldest updates"
+                )
+
+
+def has_clients() -> bool:
+    """
+    Check if any client is connected.
+
+    Clients get a full snapshot when they connect, so updates produced while
+    none are connected don't need to be sent at all.
+
+    Returns:
+        True if at least one client is connected, False otherwise
+    """
+    return bool(connections)
+
+
+def dropped_updates() -> int:
     """
-    global _loop
+    Get the number of updates dropped because the broadcast queue was full.
 
-    if _loop and _loop.is_running():
-        # Schedule the coroutine on the server's event loop
-        asyncio.run_coroutine_threadsafe(broadcast_update(update), _loop)
+    Returns:
+        Number of dropped updates
+    """
+    return _dropped_updates
 
 
 def logs_transmitted() -> bool:
@@ -174,5 +361,17 @@ def logs_transmitted() -> bool:
     Returns:
         True if logs have been sent to a client, False otherwise
     """
-    global _logs_transmitted
-    return _logs_transmitted
+    return _logs_transmitted.is_set()
+
+
+def wait_logs_transmitted(timeout: Optional[float] = None) -> bool:
+    """
+    Block until logs have been transmitted to at least one client.
+
+    Args:
+        timeout: Maximum number of seconds to wait, or None to wait forever
+
+    Returns:
+        True if logs have been sent to a client, False if the timeout expired
+    """
+    return _logs_transmitted.wait(timeout)
@@ -1,12 +1,19 @@
 """Pytest plugin for capturing test results and associating them with autopsy logs."""
 
 import pytest
+import weakref
+from threading import Lock, Timer
 from typing import Optional, List, Dict, Any
 from pathlib import Path
 
 from .report import get_report, generate_html, generate_json
 
 
+# Live mode flushes pending test results after this many tests or seconds
+BROADCAST_BATCH_SIZE = 64
+BROADCAST_BATCH_INTERVAL = 0.1
+
+
 class AutopsyTestResult:
     """Represents a single test case result."""
 
@@ -22,6 +29,23 @@ class AutopsyTestResult:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert test result to JSON-serializable dict."""
+        # Fast path for the common case: a passed test with full metadata
+        if (
+            self.outcome == "passed"
+            and self.location
+            and self.start_log_index is not None
+        ):
+            return {
+                "nodeid": self.nodeid,
+                "outcome": "passed",
+                "log_count": self.log_count,
+                "filename": str(self.location[0]),
+                "line": self.location[1],
+                "test_name": self.location[2],
+                "start_log_index": self.start_log_index,
+                "end_log_index": self.end_log_index,
+            }
+
         result = {
             "nodeid": self.nodeid,
             "outcome": self.outcome,
@@ -55,6 +79,12 @@ class AutopsyTestCapture:
         self.test_results: List[AutopsyTestResult] = []
         self.current_test: Optional[AutopsyTestResult] = None
         self.test_start_log_index: Optional[int] = None
+        # Live mode: results waiting to be broadcast as one batch
+        self._pending: List[Dict[str, Any]] = []
+        # Flushes the pending results once the batch interval has passed, so
+        # they don't wait for the next test to finish
+        self._flush_timer: Optional[Timer] = None
+        self._pending_lock = Lock()
 
     def start_test(self, nodeid: str):
         """Called when a test starts."""
@@ -93,13 +123,35 @@ class AutopsyTestCapture:
         self.test_results.append(test_result)
         self.test_start_log_index = None
 
-        # Broadcast test update in live mode
+        # Broadcast test updates in live mode, batched so large suites don't
+        # schedule one broadcast per test
         if report._live_mode_enabled:
+            with self._pending_lock:
+                self._pending.append(test_result.to_dict())
+                full = len(self._pending) >= BROADCAST_BATCH_SIZE
+                if not full and self._flush_timer is None:
+                    self._flush_timer = Timer(BROADCAST_BATCH_INTERVAL, self.flush)
+                    self._flush_timer.daemon = True
+                    self._flush_timer.start()
+            if full:
+                self.flush()
+
+    def flush(self):
+        """Broadcast any pending test results in live mode."""
+        with self._pending_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._pending:
+                return
+            results, self._pending = self._pending, []
+            # Queued under the lock so that batches from the timer and from
+            # finish_test() go out in order
             try:
                 from autopsy import live_server
                 live_server.queue_broadcast({
-                    "type": "test",
-                    "test": test_result.to_dict(),
+                    "type": "test_batch",
+                    "results": results,
                 })
             except Exception:
                 pass
@@ -118,6 +170,11 @@ def get_test_capture() -> AutopsyTestCapture:
     return _test_capture
 
 
+# Items whose result has already been recorded, so later phases don't record
+# them again. Weak so entries go away when pytest drops the item.
+_recorded_items: "weakref.WeakSet[pytest.Item]" = weakref.WeakSet()
+
+
 @pytest.hookimpl(hookwrapper=True)
 def pytest_runtest_protocol(item, nextitem):
     """Hook called for each test item."""
@@ -135,9 +192,6 @@ def pytest_runtest_makereport(item, call):
 
     # Record test results after the "call" phase, but also handle failures in other phases
     # We need to track if we've already recorded this test to avoid duplicates
-    if not hasattr(item, '_autopsy_recorded'):
-        item._autopsy_recorded = False
-
     # Record on the "call" phase (main test execution)
     if report.when == "call":
         longrepr = None
@@ -151,25 +205,25 @@ def pytest_runtest_makereport(item, call):
             longrepr = str(report.longrepr) if report.longrepr else "Test skipped"
 
         _test_capture.finish_test(item, report.outcome, longrepr, error_summary)
-        item._autopsy_recorded = True
+        _recorded_items.add(item)
 
     # If test failed during setup, record it
-    elif report.when == "setup" and report.failed and not item._autopsy_recorded:
+    elif report.when == "setup" and report.failed and item not in _recorded_items:
         longrepr = str(report.longrepr) if report.longrepr else "Setup failed"
         error_summary = None
         if hasattr(report.longrepr, 'reprcrash') and report.longrepr.reprcrash:
             error_summary = report.longrepr.reprcrash.message
         _test_capture.finish_test(item, "error", longrepr, error_summary)
-        item._autopsy_recorded = True
+        _recorded_items.add(item)
 
     # If test failed during teardown and we haven't recorded yet, record it
-    elif report.when == "teardown" and report.failed and not item._autopsy_recorded:
+    elif report.when == "teardown" and report.failed and item not in _recorded_items:
         longrepr = str(report.longrepr) if report.longrepr else "Teardown failed"
         error_summary = None
         if hasattr(report.longrepr, 'reprcrash') and report.longrepr.reprcrash:
             error_summary = report.longrepr.reprcrash.message
         _test_capture.finish_test(item, "error", longrepr, error_summary)
-        item._autopsy_recorded = True
+        _recorded_items.add(item)
 
 
 def pytest_configure(config):
@@ -184,36 +238,26 @@ def pytest_sessionfinish(session, exitstatus):
     import sys
     report = get_report()
 
+    # Send any test results still waiting for a live-mode broadcast
+    _test_capture.flush()
+
     if not report._initialized or report._written:
         return
 
     if report._config.mode == "live":
         try:
             from autopsy import live_server
-            import time
 
             # Check if there's any data to transmit
-            has_data = (
-                report._logs
-                or report._dashboard_logs
-                or report._timeline
-                or report._happened
-            )
-
-            if has_data and not live_server.logs_transmitted():
+            if report._has_data() and not live_server.logs_transmitted():
                 print("\n⏳ Waiting for client to connect and receive logs...", file=sys.stderr)
 
                 # Wait for logs to be transmitted (with timeout)
                 timeout = 300  # 5 minutes
-                start_time = time.time()
-                while not live_server.logs_transmitted():
-                    if time.time() - start_time > timeout:
-                        print("\n⚠️  Timeout: No client connected to receive logs.", file=sys.stderr)
-                        break
-                    time.sleep(0.1)
-
-                if live_server.logs_transmitted():
+                if live_server.wait_logs_transmitted(timeout):
                     print("✓ Logs transmitted to client successfully.", file=sys.stderr)
+                else:
+                    print("\n⚠️  Timeout: No client connected to receive logs.", file=sys.stderr)
         except Exception as e:
             print(f"\nWarning: Error waiting for client: {e}", file=sys.stderr)
         return
@@ -1,21 +1,271 @@
 import ast
 import atexit
-import base64
+import binascii
 import gzip
 import inspect
 import json
+import linecache
+import math
+import numbers
 import os
 import pickle
 import re
 import sys
-from dataclasses import dataclass
+import time
+from array import array
+from collections import OrderedDict, defaultdict, deque
+from dataclasses import dataclass, field, fields
 from datetime import datetime
+from functools import partial
+from itertools import compress
 from pathlib import Path
-from threading import RLock
-from typing import Any, Dict, List, Optional, Tuple
+from threading import Lock, RLock
+from types import FrameType, ModuleType
+from typing import (
+    Any,
+    DefaultDict,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from .call_stack import CallStack, StackTrace, call_stack
-from .json_utils import to_json_serializable
+from .json_utils import (
+    _SCALAR_TYPES,
+    dumps,
+    dumps_bytes,
+    sanitize_float,
+    to_json_serializable,
+)
+
+try:
+    from isal import igzip
+except ImportError:  # Optional fast compressor, see the "fast" extra
+    igzip = None
+
+try:
+    import pybase64
+except ImportError:  # Optional SIMD base64 encoder, see the "fast" extra
+    pybase64 = None
+
+
+# Frames from the autopsy package are skipped when locating the user's call
+# site (the same rule call_stack() uses to filter its frames)
+_AUTOPSY_DIR = os.path.dirname(os.path.abspath(__file__)) + os.sep
+# log() is also wrapped by the print-style logger used in the study
+_LOG_FRAME_SUFFIXES = ("logger/__init__.py", "logger\\__init__.py")
+
+# Report JSON is highly redundant, so levels above zlib's default of 6 cost
+# much more time for very little extra compression
+_GZIP_LEVEL = 6
+# ISA-L's level 3 compresses about as well as zlib's level 6, several times faster
+_ISAL_GZIP_LEVEL = 3
+
+# The report data tag in template.html, whose content generate_html() replaces
+_AUTOPSY_DATA_RE = re.compile(
+    r'(<script id="autopsy-data" type="application/json">)(.*?)(</script>)',
+    re.DOTALL,
+)
+# Data tag that replaces it, marking the embedded data as compressed
+_COMPRESSED_DATA_TAG = (
+    '<script id="autopsy-data" type="application/json" data-compressed="gzip">'
+)
+# template.html as last read by generate_html(), split around the data tag's
+# content: (st_mtime_ns, (prefix, suffix, prefix_bytes, suffix_bytes))
+_TEMPLATE_CACHE: Optional[Tuple[int, Tuple[str, str, bytes, bytes]]] = None
+
+# Call site descriptor used when argument name capture is disabled
+_EMPTY_CALL_SITE_DESCRIPTOR: Dict[str, Any] = {
+    "arg_names": [],
+    "arg_names_excl_first": [],
+    "first_arg_is_string_literal": False,
+}
+
+# log() calls per source file: filename -> (st_mtime_ns, {line: call node})
+_LOG_CALLS_CACHE: Dict[str, Tuple[int, Dict[int, ast.Call]]] = {}
+# Resolved log() call sites: (filename, line) -> (st_mtime_ns, call node, arg names)
+_CALL_CACHE: Dict[
+    Tuple[str, int], Tuple[int, Optional[ast.Call], List[Optional[str]]]
+] = {}
+_AST_CACHE_LOCK = Lock()
+
+
+class _LogCallIndexer(ast.NodeVisitor):
+    """Collect the report.log() (or print()/log()) call on each line of a module."""
+
+    def __init__(self):
+        # If a line has several matching calls, the last one visited wins
+        self.calls: Dict[int, ast.Call] = {}
+
+    def visit_Call(self, node: ast.Call):
+        # Match attribute calls: report.log(), autopsy.log(), etc.
+        if isinstance(node.func, ast.Attribute) and node.func.attr == "log":
+            if isinstance(node.func.value, ast.Name):
+                if node.func.value.id in ("report", "_report", "autopsy"):
+                    self.calls[node.lineno] = node
+            elif isinstance(node.func.value, ast.Attribute):
+                if node.func.value.attr in ("report", "_report"):
+                    self.calls[node.lineno] = node
+
+        # Match bare function calls: print(), log()
+        # (for logger.print() and similar wrappers)
+        elif isinstance(node.func, ast.Name) and node.func.id in ("print", "log"):
+            self.calls[node.lineno] = node
+
+        # Continue visiting
+        self.generic_visit(node)
+
+
+# Longest statement (in lines) parsed on its own before falling back to
+# parsing the whole file
+_MAX_FRAGMENT_LINES = 50
+
+
+def _parse_call_fragment(filename: str, line_number: int) -> Optional[ast.Call]:
+    """
+    Find the log() call on a line by parsing just the statement starting there.
+
+    Lines are added until the fragment parses, which handles calls spread
+    over several lines. This fails (returns None) when the line doesn't start
+    a statement, e.g. a call nested in an expression that began earlier.
+
+    Args:
+        filename: Path to the source file
+        line_number: Line number of the log() call
+
+    Returns:
+        AST Call node if found, None otherwise
+    """
+    linecache.checkcache(filename)
+    first_line = linecache.getline(filename, line_number)
+    if not first_line.strip():
+        return None
+
+    fragment = [first_line.lstrip()]
+    for offset in range(_MAX_FRAGMENT_LINES):
+        if offset > 0:
+            next_line = linecache.getline(filename, line_number + offset)
+            if not next_line:
+                return None
+            fragment.append(next_line)
+        try:
+            tree = ast.parse("".join(fragment), filename=filename)
+        except SyntaxError:
+            continue
+        except Exception:
+            return None
+
+        indexer = _LogCallIndexer()
+        indexer.visit(tree)
+        return indexer.calls.get(1)
+    return None
+
+
+def _log_calls_in_file(filename: str, mtime_ns: int) -> Optional[Dict[int, ast.Call]]:
+    """
+    Index the log() calls in a source file by line number.
+
+    The file is parsed and walked once; the index is reused while the file
+    is unchanged.
+
+    Args:
+        filename: Path to the source file
+        mtime_ns: Current modification time of the file in nanoseconds
+
+    Returns:
+        Dict mapping line numbers to call nodes, or None if the file can't be
+        read or parsed
+    """
+    with _AST_CACHE_LOCK:
+        cached = _LOG_CALLS_CACHE.get(filename)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    try:
+        with open(filename, "r", encoding="utf-8") as f:
+            source_code = f.read()
+        tree = ast.parse(source_code, filename=filename)
+        indexer = _LogCallIndexer()
+        indexer.visit(tree)
+    except Exception:
+        return None
+
+    with _AST_CACHE_LOCK:
+        _LOG_CALLS_CACHE[filename] = (mtime_ns, indexer.calls)
+    return indexer.calls
+
+
+# Pickles only live as long as the process, so there's no need for the
+# older, more portable default protocol
+_PICKLE_PROTOCOL = pickle.HIGHEST_PROTOCOL
+
+
+def _pickle_value(value: Any) -> Union[bytes, str]:
+    """
+    Pickle a logged value for storage.
+
+    Args:
+        value: The value to pickle
+
+    Returns:
+        The pickled bytes, or a "<PickleError: ...>" string if pickling fails
+    """
+    try:
+        return pickle.dumps(value, _PICKLE_PROTOCOL)
+    except Exception as e:
+        return f"<PickleError: {str(e)}>"
+
+
+# Immutable (and so hashable) types whose values are stored as-is by log():
+# a value that can't change after being logged doesn't need a pickled
+# snapshot. Also used directly as count() keys.
+_IMMUTABLE_VALUE_TYPES = frozenset(
+    {int, float, complex, str, bytes, bool, type(None)}
+)
+
+# Largest magnitude up to which every int is exactly representable as a double
+_MAX_EXACT_FLOAT_INT = 2**53
+
+# Strings and bytes at least this long are pickled once per object and the
+# result shared by every log() of that object (see Report._pickle_for_log)
+_PICKLE_CACHE_MIN_SIZE = 256
+_PICKLE_CACHE_CAPACITY = 1024
+
+# Warnings written by Report.init() when it's called on a report with data
+_WARN_CLEAR = "Warning: Report.init() clearing existing data.\n"
+_WARN_REINIT = (
+    "Warning: Report.init() called on initialized report with existing data.\n"
+)
+
+
+def _call_site_json(
+    call_site: Tuple[str, int], function_name: str, class_name: Optional[str]
+) -> Dict[str, Any]:
+    """
+    Build the "call_site" object used for a dashboard call site in to_json().
+
+    Args:
+        call_site: (filename, line_number) of the call site
+        function_name: Name of the function containing the call
+        class_name: Class name if the call is in a method, None otherwise
+
+    Returns:
+        Dict with filename, line, function_name and (for methods) class_name
+    """
+    filename, line_number = call_site
+    result: Dict[str, Any] = {
+        "filename": filename,
+        "line": line_number,
+        "function_name": function_name,
+    }
+    if class_name is not None:
+        result["class_name"] = class_name
+    return result
 
 
 @dataclass
@@ -26,6 +276,317 @@ class ReportConfiguration:
     mode: str = "json"  # "json", "html", or "live"
     live_mode_host: str = "localhost"
     live_mode_port: int = 8765
+    # Extract argument expressions (and infer names from a leading string
+    # literal) by parsing the caller's source. Disable to skip all AST work.
+    capture_arg_names: bool = True
+    # Keep the live call stack and only capture the trace when the report is
+    # serialized. Cheaper per call, but local variables reflect their values
+    # at serialization time and frames are kept alive until then.
+    defer_stack_traces: bool = False
+    # Store logged values by reference and only pickle them when get_logs() is
+    # called. Avoids pickling on every call, but values mutated after being
+    # logged are reported with their later contents.
+    defer_pickling: bool = False
+    # Record nothing: log() and the dashboard methods return immediately, so
+    # calls can be left in code that runs without reporting
+    enabled: bool = True
+    # Capture each stack frame's local variables. Disable for smaller, faster
+    # traces that only show where each event came from.
+    include_locals: bool = True
+    # Keep at most this many frames per stack trace, innermost first. None
+    # keeps every frame.
+    max_stack_frames: Optional[int] = None
+    # Keep only the most recent events per call site (and in the timeline as
+    # a whole), dropping older ones along with their stack traces. None keeps
+    # everything.
+    max_events_per_call_site: Optional[int] = None
+
+
+@dataclass(slots=True)
+class LogGroup:
+    """Values captured by one log() call, with metadata about the invocation."""
+
+    values: List[Any]  # pickled bytes, or a "<PickleError: ...>" string
+    function_name: str
+    arg_names: List[Optional[str]]
+    log_index: int
+    class_name: Optional[str] = None
+    stack_trace_id: Optional[int] = None
+    name: Optional[str] = None
+    # False when values holds the logged objects themselves (defer_pickling,
+    # or all of them immutable)
+    pickled: bool = True
+    # JSON form of values, kept once built (by to_json() or a live mode
+    # broadcast) so that later snapshots only convert newly logged groups
+    json_values: Optional[List[Dict[str, Any]]] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a dict with pickled values, omitting optional fields that aren't set."""
+        result = {
+            f.name: getattr(self, f.name)
+            for f in fields(self)
+            if f.name not in ("pickled", "json_values")
+            and getattr(self, f.name) is not None
+        }
+        if not self.pickled:
+            result["values"] = [_pickle_value(value) for value in self.values]
+        return result
+
+
+@dataclass(slots=True)
+class DashboardLog:
+    """One count/hist/timeline/happened invocation."""
+
+    log_index: int
+    dashboard_type: str  # "count", "hist", "timeline", or "happened"
+    function_name: str
+    class_name: Optional[str] = None
+    stack_trace_id: Optional[int] = None
+    value: Any = None  # count and hist
+    event_name: Optional[str] = None  # timeline
+    timestamp: Optional[float] = None  # timeline
+    message: Optional[str] = None  # happened
+
+
+# How HistogramSamples stores a hist() sample, by the sample's type
+_FLOAT_SAMPLE = 0  # as a double
+_INT_SAMPLE = 1  # as a double, flagged to be given back as an int
+_OTHER_SAMPLE = 2  # as is, in other_values
+# Filled in by _sample_kind() as new types are seen. bools are kept as they
+# are rather than counted as ints.
+_SAMPLE_KINDS: Dict[type, int] = {
+    float: _FLOAT_SAMPLE,
+    int: _INT_SAMPLE,
+    bool: _OTHER_SAMPLE,
+}
+
+
+def _sample_kind(value_type: type) -> int:
+    """How a hist() sample of the given type is stored in HistogramSamples."""
+    kind = _SAMPLE_KINDS.get(value_type)
+    if kind is None:
+        # numpy scalars and other numeric types register with numbers
+        if issubclass(value_type, numbers.Integral):
+            kind = _INT_SAMPLE
+        elif issubclass(value_type, numbers.Real):
+            kind = _FLOAT_SAMPLE
+        else:
+            kind = _OTHER_SAMPLE
+        _SAMPLE_KINDS[value_type] = kind
+    return kind
+
+
+@dataclass(slots=True)
+class HistogramSamples:
+    """
+    hist() samples for one call site, stored as parallel typed arrays.
+
+    Real numbers go in the typed values array, with ints (up to 2**53, which
+    a double holds exactly) flagged so that they're given back as ints.
+    Anything else is kept as is in other_values.
+    """
+
+    # NaN where the sample is in other_values instead
+    values: "array[float]" = field(default_factory=lambda: array("d"))
+    # 1 where the sample was an int
+    int_flags: "array[int]" = field(default_factory=lambda: array("b"))
+    # -1 where no stack trace was captured
+    stack_trace_ids: "array[int]" = field(default_factory=lambda: array("q"))
+    log_indices: "array[int]" = field(default_factory=lambda: array("q"))
+    # Samples that aren't stored in values, by log index
+    other_values: Dict[int, Any] = field(default_factory=dict)
+    # Only the most recent max_samples samples are kept, if set
+    max_samples: Optional[int] = None
+
+    def append(self, value: Any, stack_trace_id: int, log_index: int):
+        """
+        Add a sample.
+
+        Args:
+            value: The sampled value
+            stack_trace_id: ID of the sample's stack trace, or -1 if none
+            log_index: Log index of the hist() call
+        """
+        self._add_value(value, log_index)
+        self.stack_trace_ids.append(stack_trace_id)
+        self.log_indices.append(log_index)
+        self._trim()
+
+    def extend(self, values: List[Any], stack_trace_id: int, first_log_index: int):
+        """
+        Add a batch of samples with consecutive log indices and one stack trace.
+
+        Args:
+            values: The sampled values
+            stack_trace_id: ID of the batch's stack trace, or -1 if none
+            first_log_index: Log index of the first sample
+        """
+        # Batches are usually all of one or two types, so classify the types
+        # rather than each sample
+        kinds = {_sample_kind(value_type) for value_type in set(map(type, values))}
+        if kinds == {_FLOAT_SAMPLE}:
+            # Converted to doubles in one go
+            self.values.extend(array("d", values))
+            self.int_flags.extend(array("b", bytes(len(values))))
+        elif (
+            _OTHER_SAMPLE not in kinds
+            and -_MAX_EXACT_FLOAT_INT <= min(values)
+            and max(values) <= _MAX_EXACT_FLOAT_INT
+        ):
+            # Ints, possibly mixed with floats, that doubles hold exactly
+            self.values.extend(array("d", values))
+            # A sample's kind is also its int flag
+            self.int_flags.extend(
+                array("b", map(_SAMPLE_KINDS.__getitem__, map(type, values)))
+            )
+        else:
+            for log_index, value in enumerate(values, first_log_index):
+                self._add_value(value, log_index)
+        self.stack_trace_ids.extend(array("q", [stack_trace_id]) * len(values))
+        self.log_indices.extend(
+            array("q", range(first_log_index, first_log_index + len(values)))
+        )
+        self._trim()
+
+    def _add_value(self, value: Any, log_index: int):
+        """Add a sample's value to values and int_flags (or other_values)."""
+        kind = _sample_kind(type(value))
+        if kind == _INT_SAMPLE and not (
+            -_MAX_EXACT_FLOAT_INT <= value <= _MAX_EXACT_FLOAT_INT
+        ):
+            kind = _OTHER_SAMPLE
+        if kind == _OTHER_SAMPLE:
+            self.other_values[log_index] = value
+            value = math.nan
+        self.values.append(value)
+        self.int_flags.append(kind == _INT_SAMPLE)
+
+    def _trim(self):
+        """Drop old samples in bulk once there are twice as many as we keep."""
+        # Trimming in bulk means the arrays aren't shifted on every append
+        if self.max_samples is not None and len(self.values) >= 2 * self.max_samples:
+            excess = len(self.values) - self.max_samples
+            if self.other_values:
+                for log_index in self.log_indices[:excess]:
+                    self.other_values.pop(log_index, None)
+            del self.values[:excess]
+            del self.int_flags[:excess]
+            del self.stack_trace_ids[:excess]
+            del self.log_indices[:excess]
+
+    def __len__(self) -> int:
+        start = self._start()
+        return len(self.values) - start
+
+    def __iter__(self) -> Iterator[Tuple[Any, int, int]]:
+        """Iterate over the kept (value, stack_trace_id, log_index) samples."""
+        return zip(*self.columns())
+
+    def columns(self) -> Tuple[List[Any], List[int], List[int]]:
+        """
+        Get the kept samples as lists, one per column.
+
+        Returns:
+            Tuple of (values, stack_trace_ids, log_indices) lists
+        """
+        start = self._start()
+        values = self.values[start:].tolist()
+        int_flags = self.int_flags[start:]
+        if 1 in int_flags:
+            for position in compress(range(len(values)), int_flags):
+                values[position] = int(values[position])
+        log_indices = self.log_indices[start:].tolist()
+        if self.other_values:
+            other_values = self.other_values
+            for position, log_index in enumerate(log_indices):
+                if log_index in other_values:
+                    values[position] = other_values[log_index]
+        return (
+            values,
+            self.stack_trace_ids[start:].tolist(),
+            log_indices,
+        )
+
+    def _start(self) -> int:
+        """Index of the oldest sample that's kept."""
+        if self.max_samples is None:
+            return 0
+        return max(0, len(self.values) - self.max_samples)
+
+
+@dataclass(slots=True)
+class TraceReferences:
+    """
+    (stack_trace_id, log_index) pairs recorded by count() for one value, or by
+    happened() for one call site, stored as parallel typed arrays.
+    """
+
+    # -1 where no stack trace was captured
+    stack_trace_ids: "array[int]" = field(default_factory=lambda: array("q"))
+    log_indices: "array[int]" = field(default_factory=lambda: array("q"))
+    # Only the most recent max_items pairs are kept, if set
+    max_items: Optional[int] = None
+    # Number of pairs ever added, including ones no longer kept
+    total: int = 0
+
+    def append(self, stack_trace_id: int, log_index: int):
+        """
+        Add a pair.
+
+        Args:
+            stack_trace_id: ID of the invocation's stack trace, or -1 if none
+            log_index: Log index of the invocation
+        """
+        self.stack_trace_ids.append(stack_trace_id)
+        self.log_indices.append(log_index)
+        self.total += 1
+
+        # Drop old pairs in bulk, as in HistogramSamples.append
+        if self.max_items is not None and len(self.log_indices) >= 2 * self.max_items:
+            excess = len(self.log_indices) - self.max_items
+            del self.stack_trace_ids[:excess]
+            del self.log_indices[:excess]
+
+    def __len__(self) -> int:
+        return len(self.log_indices) - self._start()
+
+    def columns(self) -> Tuple[List[int], List[int]]:
+        """
+        Get the kept pairs as lists, one per column.
+
+        Returns:
+            Tuple of (stack_trace_ids, log_indices) lists
+        """
+        start = self._start()
+        return self.stack_trace_ids[start:].tolist(), self.log_indices[start:].tolist()
+
+    def _start(self) -> int:
+        """Index of the oldest pair that's kept."""
+        if self.max_items is None:
+            return 0
+        return max(0, len(self.log_indices) - self.max_items)
+
+
+@dataclass(frozen=True, slots=True)
+class _UnhashableCountKey:
+    """count() key for a value that can't be used as a dict key itself."""
+
+    type_name: str
+    value_repr: str
+    # JSON form of the value when it was first counted; not part of the key
+    json_value: str = field(compare=False)
+
+
+@dataclass(slots=True)
+class _HappenedRecord:
+    """Per call site state for happened()."""
+
+    message: Optional[str]
+    # (stack_trace_id, log_index) for each invocation with a stack trace
+    trace_ids: TraceReferences
+    # Built once, see _call_site_json
+    call_site_json: Dict[str, Any]
+    count: int = 0
 
 
 class Report:
@@ -40,42 +601,67 @@ class Report:
         """
         # Store groups of values with metadata, where each group represents one log() call
         # Format: Dict[call_site, List[LogGroup]]
-        # LogGroup contains: values (list of pickled values), function_name, arg_names, log_index
-        self._logs: Dict[Tuple[str, int], List[Dict[str, Any]]] = {}
+        self._logs: DefaultDict[
+            Tuple[str, int], Union[List[LogGroup], Deque[LogGroup]]
+        ] = defaultdict(self._new_events)
         # Global log index to track total ordering across all log calls
         self._log_index: int = 0
         # Configuration
         self._config = config if config is not None else ReportConfiguration()
         # Stack traces stored by log index (each log has its own unique stack trace)
-        self._stack_traces: Dict[int, StackTrace] = {}
+        # With defer_stack_traces, a CallStack is stored until the trace is first read
+        self._stack_traces: Dict[int, Union[StackTrace, CallStack]] = {}
         # Dashboard data storage
-        # Counts: per call site, value -> list of (stack_trace_id, log_index) tuples
-        self._counts: Dict[Tuple[str, int], Dict[Any, List[Tuple[int, int]]]] = {}
-        # Counts metadata: per call site, (function_name, class_name)
-        self._counts_metadata: Dict[Tuple[str, int], Tuple[str, Optional[str]]] = {}
-        # Histograms: per call site, list of (number, stack_trace_id, log_index) tuples
-        self._histograms: Dict[Tuple[str, int], List[Tuple[float, int, int]]] = {}
-        # Histograms metadata: per call site, (function_name, class_name)
-        self._histograms_metadata: Dict[Tuple[str, int], Tuple[str, Optional[str]]] = {}
-        # Timeline: global list of events with timestamp, event_name, call_site, stack_trace_id
-        self._timeline: List[Dict[str, Any]] = []
-        # Happened: per call site, (count, list of (stack_trace_id, log_index) tuples, optional message)
-        self._happened: Dict[
-            Tuple[str, int], Tuple[int, List[Tuple[int, int]], Optional[str]]
-        ] = {}
-        # Happened metadata: per call site, (function_name, class_name)
-        self._happened_metadata: Dict[Tuple[str, int], Tuple[str, Optional[str]]] = {}
+        # Counts: per call site, value -> (stack_trace_id, log_index) pairs
+        self._counts: DefaultDict[
+            Tuple[str, int], Dict[Any, TraceReferences]
+        ] = defaultdict(dict)
+        # Counts metadata: per call site, the "call_site" object for to_json()
+        self._counts_metadata: Dict[Tuple[str, int], Dict[str, Any]] = {}
+        # Histograms: per call site, samples with their stack_trace_id and log_index
+        self._histograms: DefaultDict[Tuple[str, int], HistogramSamples] = defaultdict(
+            self._new_histogram
+        )
+        # Histograms metadata: per call site, the "call_site" object for to_json()
+        self._histograms_metadata: Dict[Tuple[str, int], Dict[str, Any]] = {}
+        # Timeline: global list of (call_site, DashboardLog) events. The
+        # DashboardLog is the same object stored in _dashboard_logs.
+        self._timeline: Union[
+            List[Tuple[Tuple[str, int], DashboardLog]],
+            Deque[Tuple[Tuple[str, int], DashboardLog]],
+        ] = self._new_events()
+        # Whether _timeline is in timestamp order, which is only False if the
+        # clock went backwards between two events
+        self._timeline_in_order = True
+        # Happened: per call site, count, (stack_trace_id, log_index) tuples,
+        # optional message and the function/class names resolved on the first call
+        self._happened: Dict[Tuple[str, int], _HappenedRecord] = {}
         # Dashboard logs: per call site, list of dashboard invocation logs
         # TODO: Eventually unify dashboard logs with regular log() call sites.
         # Instead of maintaining separate _dashboard_logs storage, we should store dashboard
         # visualization metadata (count/hist/timeline/happened) as additional metadata on
         # call sites in _logs, eliminating the need for separate storage.
-        # Format: Dict[call_site, List[DashboardLogGroup]]
-        # DashboardLogGroup contains: log_index, dashboard_type, stack_trace_id, function_name, class_name, and type-specific data
-        self._dashboard_logs: Dict[Tuple[str, int], List[Dict[str, Any]]] = {}
+        # Format: Dict[call_site, List[DashboardLog]]
+        self._dashboard_logs: DefaultDict[
+            Tuple[str, int], Union[List[DashboardLog], Deque[DashboardLog]]
+        ] = defaultdict(self._new_events)
+        # Per call site metadata for log(), built once from the AST
+        # Format: Dict[call_site, descriptor dict] (see _call_site_descriptor)
+        self._call_site_cache: Dict[Tuple[str, int], Dict[str, Any]] = {}
+        # Recently pickled large strings/bytes: id(value) -> (value, pickled)
+        # Holding the value keeps its id from being reused while cached
+        self._pickle_cache: "OrderedDict[int, Tuple[Any, Union[bytes, str]]]" = (
+            OrderedDict()
+        )
+        # Recently stored large pickles of other values, so that logging
+        # equal objects keeps one copy of their bytes: pickled -> pickled
+        self._pickle_store: "OrderedDict[bytes, bytes]" = OrderedDict()
+        self._pickle_cache_lock = Lock()
         # Thread safety
         self._lock = RLock()  # Reentrant lock for nested calls
-        self._live_mode_enabled = False
+        # The live_server module once live mode is enabled, so that broadcasts
+        # don't import it on every call
+        self._live_server: Optional[ModuleType] = None
         # Tracking for lazy initialization and auto-write
         self._initialized = False
         self._written = False
@@ -100,115 +686,11 @@ class Report:
             String representation of the expression, or None if not extractable
         """
         try:
-            # Use ast.unparse if available (Python 3.9+)
-            if hasattr(ast, "unparse"):
-                return ast.unparse(node)
+            # Argument expressions repeat across call sites, so share the strings
+            return sys.intern(ast.unparse(node))
         except Exception:
-            pass
-
-        # Fallback: manually reconstruct common patterns
-        if isinstance(node, ast.Name):
-            return node.id
-        elif isinstance(node, ast.Attribute):
-            # Handle attribute access like obj.attr or obj.attr.subattr
-            parts: List[str] = []
-            current: ast.expr = node
-            while isinstance(current, ast.Attribute):
-                parts.insert(0, current.attr)
-                current = current.value
-            if isinstance(current, ast.Name):
-                parts.insert(0, current.id)
-                return ".".join(parts)
-            return None
-        elif isinstance(node, ast.Call):
-            # Handle function/method calls
-            func_str = self._ast_node_to_expression(node.func)
-            if func_str:
-                args_str = ", ".join(
-                    self._ast_node_to_expression(arg) or "" for arg in node.args
-                )
-                return f"{func_str}({args_str})"
-            return None
-        elif isinstance(node, ast.Constant):
-            # Literal values - return None to indicate no expression name
-            return None
-        elif isinstance(node, ast.BinOp):
-            # Binary operations like x + y, a * b, etc.
-            left = self._ast_node_to_expression(node.left)
-            right = self._ast_node_to_expression(node.right)
-            op_str = self._binop_to_str(node.op)
-            if left and right and op_str:
-                return f"{left} {op_str} {right}"
-            return None
-        elif isinstance(node, ast.UnaryOp):
-            # Unary operations like -x, not y, etc.
-            operand = self._ast_node_to_expression(node.operand)
-            op_str = self._unaryop_to_str(node.op)
-            if operand and op_str:
-                return f"{op_str}{operand}"
-            return None
-        elif isinstance(node, ast.Compare):
-            # Comparisons like x < y, a == b, etc.
-            left = self._ast_node_to_expression(node.left)
-            if not left:
-                return None
-            parts = [left]
-            for op, comparator in zip(node.ops, node.comparators):
-                comp_str = self._ast_node_to_expression(comparator)
-                op_str = self._cmpop_to_str(op)
-                if comp_str and op_str:
-                    parts.append(f"{op_str} {comp_str}")
-                else:
-                    return None
-            return " ".join(parts)
-        else:
-            # For other expression types, return None
             return None
 
-    def _binop_to_str(self, op: ast.operator) -> Optional[str]:
-        """Convert binary operator to string."""
-        op_map = {
-            ast.Add: "+",
-            ast.Sub: "-",
-            ast.Mult: "*",
-            ast.Div: "/",
-            ast.FloorDiv: "//",
-            ast.Mod: "%",
-            ast.Pow: "**",
-            ast.LShift: "<<",
-            ast.RShift: ">>",
-            ast.BitOr: "|",
-            ast.BitXor: "^",
-            ast.BitAnd: "&",
-        }
-        return op_map.get(type(op))
-
-    def _unaryop_to_str(self, op: ast.unaryop) -> Optional[str]:
-        """Convert unary operator to string."""
-        op_map = {
-            ast.UAdd: "+",
-            ast.USub: "-",
-            ast.Not: "not ",
-            ast.Invert: "~",
-        }
-        return op_map.get(type(op))
-
-    def _cmpop_to_str(self, op: ast.cmpop) -> Optional[str]:
-        """Convert comparison operator to string."""
-        op_map = {
-            ast.Eq: "==",
-            ast.NotEq: "!=",
-            ast.Lt: "<",
-            ast.LtE: "<=",
-            ast.Gt: ">",
-            ast.GtE: ">=",
-            ast.Is: "is",
-            ast.IsNot: "is not",
-            ast.In: "in",
-            ast.NotIn: "not in",
-        }
-        return op_map.get(type(op))
-
     def _find_log_call_ast(self, filename: str, line_number: int) -> Optional[ast.Call]:
         """
         Find the AST node for a report.log() or autopsy.log() call at the given line.
@@ -221,54 +703,63 @@ class Report:
             AST Call node if found, None otherwise
         """
         try:
-            with open(filename, "r", encoding="utf-8") as f:
-                source_code = f.read()
-
-            # Parse the entire file with AST
-            tree = ast.parse(source_code, filename=filename)
-
-            # Walk the AST to find the call site
-            class LogCallFinder(ast.NodeVisitor):
-                def __init__(self, target_line: int):
-                    self.target_line = target_line
-                    self.found_call: Optional[ast.Call] = None
-
-                def visit_Call(self, node: ast.Call):
-                    if node.lineno != self.target_line:
-                        self.generic_visit(node)
-                        return
-
-                    # Match attribute calls: report.log(), autopsy.log(), etc.
-                    if (
-                        isinstance(node.func, ast.Attribute)
-                        and node.func.attr == "log"
-                    ):
-                        if isinstance(node.func.value, ast.Name):
-                            if node.func.value.id in ("report", "_report", "autopsy"):
-                                self.found_call = node
-                        elif isinstance(node.func.value, ast.Attribute):
-                            if node.func.value.attr in ("report", "_report"):
-                                self.found_call = node
-
-                    # Match bare function calls: print(), log()
-                    # (for logger.print() and similar wrappers)
-                    elif (
-                        isinstance(node.func, ast.Name)
-                        and node.func.id in ("print", "log")
-                    ):
-                        self.found_call = node
-
-                    # Continue visiting
-                    self.generic_visit(node)
-
-            finder = LogCallFinder(line_number)
-            finder.visit(tree)
-
-            return finder.found_call
+            mtime_ns = os.stat(filename).st_mtime_ns
+        except OSError:
+            return None
 
-        except Exception:
-            # If AST parsing fails, return None
+        # A file's first call site is usually found by parsing just its own
+        # statement, so short runs don't pay to parse large files
+        with _AST_CACHE_LOCK:
+            indexed = filename in _LOG_CALLS_CACHE
+        if not indexed:
+            call_node = _parse_call_fragment(filename, line_number)
+            if call_node is not None:
+                return call_node
+
+        # Look the line up in the file's index of log() calls
+        log_calls = _log_calls_in_file(filename, mtime_ns)
+        if log_calls is None:
             return None
+        return log_calls.get(line_number)
+
+    def _resolve_call_site(
+        self, filename: str, line_number: int
+    ) -> Tuple[Optional[ast.Call], List[Optional[str]]]:
+        """
+        Resolve the log() call at a call site and its argument expressions.
+
+        Results are cached per call site until the source file changes, so
+        repeated calls from the same line don't re-read or re-walk the file.
+
+        Args:
+            filename: Path to the source file
+            line_number: Line number of the log() call
+
+        Returns:
+            Tuple of (call node or None, argument names). Callers must not
+            mutate the returned list.
+        """
+        try:
+            mtime_ns = os.stat(filename).st_mtime_ns
+        except OSError:
+            return None, []
+
+        key = (filename, line_number)
+        with _AST_CACHE_LOCK:
+            cached = _CALL_CACHE.get(key)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1], cached[2]
+
+        call_node = self._find_log_call_ast(filename, line_number)
+        arg_names: List[Optional[str]] = []
+        if call_node is not None:
+            # Extract argument expressions from the AST nodes
+            for arg in call_node.args:
+                arg_names.append(self._ast_node_to_expression(arg))
+
+        with _AST_CACHE_LOCK:
+            _CALL_CACHE[key] = (mtime_ns, call_node, arg_names)
+        return call_node, arg_names
 
     def _extract_arg_names(
         self, filename: str, line_number: int
@@ -283,46 +774,72 @@ class Report:
         Returns:
             List of argument names (or None if extraction fails)
         """
-        call_node = self._find_log_call_ast(filename, line_number)
-        if call_node is None:
-            return []
-
-        # Extract argument expressions from the AST nodes
-        arg_names: List[Optional[str]] = []
-        for arg in call_node.args:
-            expr = self._ast_node_to_expression(arg)
-            arg_names.append(expr)
-
-        return arg_names
+        _, arg_names = self._resolve_call_site(filename, line_number)
+        return list(arg_names)
 
-    def _infer_name_from_first_arg(
-        self, filename: str, line_number: int, first_arg_value: Any
-    ) -> Optional[str]:
+    def _call_site_descriptor(
+        self, filename: str, line_number: int
+    ) -> Dict[str, Any]:
         """
-        Infer a name from the first argument if it's a string literal.
+        Get the cached metadata log() needs about the call at a call site.
+
+        The descriptor is built from the AST on the first call from a site and
+        reused afterwards without touching the file: the line numbers of the
+        running code are fixed when it's loaded, so re-reading a file edited
+        mid-run could only produce a mismatched AST.
 
         Args:
             filename: Path to the source file
             line_number: Line number of the log() call
-            first_arg_value: The actual value of the first argument
 
         Returns:
-            The string literal value if the first argument is a constant string literal,
-            None otherwise
+            Dict with 'arg_names' (all argument expressions),
+            'arg_names_excl_first' (without the first argument), and
+            'first_arg_is_string_literal'. Callers must not mutate it.
         """
-        call_node = self._find_log_call_ast(filename, line_number)
-        if call_node is None or len(call_node.args) == 0:
-            return None
+        key = (filename, line_number)
+        descriptor = self._call_site_cache.get(key)
+        if descriptor is None:
+            call_node, arg_names = self._resolve_call_site(filename, line_number)
+            first_arg_is_string_literal = (
+                call_node is not None
+                and len(call_node.args) > 0
+                and isinstance(call_node.args[0], ast.Constant)
+                and isinstance(call_node.args[0].value, str)
+            )
+            descriptor = {
+                "arg_names": arg_names,
+                "arg_names_excl_first": arg_names[1:],
+                "first_arg_is_string_literal": first_arg_is_string_literal,
+            }
+            self._call_site_cache[key] = descriptor
+        return descriptor
 
-        first_arg_node = call_node.args[0]
+    def _caller_frame(self, skip_suffixes: Tuple[str, ...] = ()) -> FrameType:
+        """
+        Find the first frame outside autopsy above the calling report method.
 
-        # Check if it's a string literal constant
-        if isinstance(first_arg_node, ast.Constant):
-            if isinstance(first_arg_value, str):
-                # It's a string literal - return the value
-                return first_arg_value
+        Walks frame objects directly rather than using inspect.stack(), which
+        would build a FrameInfo (and read source context) for every frame.
 
-        return None
+        Args:
+            skip_suffixes: Filename suffixes of other frames to skip
+
+        Returns:
+            The user's frame, or the report method's immediate caller if every
+            frame is skipped
+        """
+        # Frame 0 is this method and frame 1 the report method calling it
+        start = sys._getframe(2)
+        frame: Optional[FrameType] = start
+        while frame is not None:
+            filename = frame.f_code.co_filename
+            if not (
+                filename.startswith(_AUTOPSY_DIR) or filename.endswith(skip_suffixes)
+            ):
+                break
+            frame = frame.f_back
+        return frame if frame is not None else start
 
     def log(self, *args, name: Optional[str] = None):
         """
@@ -333,131 +850,323 @@ class Report:
             name: Optional name for this log entry. If not provided and the first
                   argument is a string literal, it will be inferred as the name.
         """
+        if not self._config.enabled:
+            return
         self._ensure_initialized()
-        with self._lock:
-            # Get the call site (file path and line number) from the caller's frame
-            stack = inspect.stack()
-            # Skip frames from autopsy module itself
-            caller_frame = None
-            for frame_info in stack[1:]:  # Skip current frame
-                # Skip any frame from within the autopsy package
-                if not frame_info.filename.endswith(("autopsy/report.py", "autopsy/__init__.py", "logger/__init__.py")):
-                    caller_frame = frame_info
-                    break
-
-            if caller_frame is None:
-                # Fallback if we can't find a non-autopsy frame
-                caller_frame = stack[1]
-
-            call_site = (caller_frame.filename, caller_frame.lineno)
-
-            # Get function name and class name (if it's a method)
-            function_name = caller_frame.function
-            class_name = None
-            frame = caller_frame.frame
-            if "self" in frame.f_locals:
-                self_obj = frame.f_locals["self"]
-                class_name = type(self_obj).__name__
+        # Everything up to storing the group only touches this call's data, so
+        # it runs without the lock to let concurrent loggers overlap
+        # Get the call site (file path and line number) from the caller's frame,
+        # skipping frames from autopsy itself
+        frame = self._caller_frame(_LOG_FRAME_SUFFIXES)
+        filename = frame.f_code.co_filename
+        line_number = frame.f_lineno
+        call_site = (filename, line_number)
 
-            # Infer name from first argument if not provided and first arg is a string literal constant
-            inferred_name: Optional[str] = None
-            args_to_store = list(args)
-            arg_names_to_store: List[Optional[str]] = []
+        # Get function name and class name (if it's a method)
+        function_name, class_name = self._frame_names(frame)
 
-            if name is None and len(args) > 0:
-                inferred_name = self._infer_name_from_first_arg(
-                    caller_frame.filename, caller_frame.lineno, args[0]
-                )
-                if inferred_name is not None:
-                    # Exclude the first argument from storage
-                    args_to_store = list(args[1:])
-                    # Extract arg names excluding the first one
-                    all_arg_names = self._extract_arg_names(
-                        caller_frame.filename, caller_frame.lineno
-                    )
-                    arg_names_to_store = all_arg_names[1:] if len(all_arg_names) > 1 else []
-                else:
-                    # No inference, use all args
-                    arg_names_to_store = self._extract_arg_names(
-                        caller_frame.filename, caller_frame.lineno
-                    )
-            else:
-                # Name provided explicitly, use all args
-                arg_names_to_store = self._extract_arg_names(
-                    caller_frame.filename, caller_frame.lineno
-                )
+        # Look up the call's argument names and first-argument shape
+        if self._config.capture_arg_names:
+            descriptor = self._call_site_descriptor(filename, line_number)
+        else:
+            descriptor = _EMPTY_CALL_SITE_DESCRIPTOR
+
+        # Infer name from first argument if not provided and first arg is a string literal constant
+        inferred_name: Optional[str] = None
+        args_to_store = list(args)
+        arg_names_to_store: List[Optional[str]] = []
+
+        if (
+            name is None
+            and args
+            and isinstance(args[0], str)
+            and descriptor["first_arg_is_string_literal"]
+        ):
+            inferred_name = args[0]
+            # Exclude the first argument from storage
+            args_to_store = list(args[1:])
+            arg_names_to_store = list(descriptor["arg_names_excl_first"])
+        else:
+            # No inference (or name provided explicitly), use all args
+            arg_names_to_store = list(descriptor["arg_names"])
 
-            # Use inferred name if available, otherwise use explicit name
-            log_name = inferred_name if inferred_name is not None else name
+        # Use inferred name if available, otherwise use explicit name
+        log_name = inferred_name if inferred_name is not None else name
 
-            # Pad or truncate arg_names to match actual number of arguments to store
-            if len(arg_names_to_store) < len(args_to_store):
-                arg_names_to_store.extend(
-                    [None] * (len(args_to_store) - len(arg_names_to_store))
-                )
-            elif len(arg_names_to_store) > len(args_to_store):
-                arg_names_to_store = arg_names_to_store[: len(args_to_store)]
+        # Pad or truncate arg_names to match actual number of arguments to store
+        if len(arg_names_to_store) < len(args_to_store):
+            arg_names_to_store.extend(
+                [None] * (len(args_to_store) - len(arg_names_to_store))
+            )
+        elif len(arg_names_to_store) > len(args_to_store):
+            arg_names_to_store = arg_names_to_store[: len(args_to_store)]
+
+        # Check if any argument is a CallStack instance, otherwise create one
+        # Always capture stack trace if auto_stack_trace is enabled
+        stack_trace: Optional[Union[StackTrace, CallStack]] = None
+        call_stack_obj: Optional[CallStack] = None
+
+        # First, check if a CallStack was passed in args_to_store
+        for value in args_to_store:
+            if isinstance(value, CallStack):
+                call_stack_obj = value
+                break
 
-            # Check if any argument is a CallStack instance, otherwise create one
-            # Always capture stack trace if auto_stack_trace is enabled
-            stack_trace_id: Optional[int] = None
-            call_stack_obj: Optional[CallStack] = None
-
-            # First, check if a CallStack was passed in args_to_store
-            for value in args_to_store:
-                if isinstance(value, CallStack):
-                    call_stack_obj = value
-                    break
-
-            # If no CallStack was passed and auto_stack_trace is enabled, create one
-            if call_stack_obj is None and self._config.auto_stack_trace:
-                call_stack_obj = call_stack()
-
-            # Capture stack trace if we have a CallStack and auto_stack_trace is enabled
-            if call_stack_obj is not None and self._config.auto_stack_trace:
-                # Capture stack trace lazily (only captures when this is called)
-                trace = call_stack_obj.capture_stack_trace()
-                # Use the current log index as the stack trace ID
-                stack_trace_id = self._log_index
-                # Store the trace
-                self._stack_traces[stack_trace_id] = trace
+        # If no CallStack was passed and auto_stack_trace is enabled, create one
+        if call_stack_obj is None and self._config.auto_stack_trace:
+            call_stack_obj = call_stack()
 
-            # Serialize and store the values as a group
-            serialized_values = []
-            for value in args_to_store:
-                try:
-                    # Pickle the value for storage
-                    pickled = pickle.dumps(value)
-                    serialized_values.append(pickled)
-                except Exception as e:
-                    # Store error info if pickling fails
-                    serialized_values.append(f"<PickleError: {str(e)}>")
+        # Capture stack trace if we have a CallStack and auto_stack_trace is enabled
+        if call_stack_obj is not None and self._config.auto_stack_trace:
+            stack_trace = self._stack_trace_to_store(call_stack_obj)
 
-            # Store the group with metadata including log index for total ordering
-            log_group = {
-                "values": serialized_values,
-                "function_name": function_name,
-                "arg_names": arg_names_to_store,
-                "log_index": self._log_index,
-            }
-            if class_name is not None:
-                log_group["class_name"] = class_name
-            if stack_trace_id is not None:
-                log_group["stack_trace_id"] = stack_trace_id
-            if log_name is not None:
-                log_group["name"] = log_name
-
-            # Increment the global log index
+        # Serialize and store the values as a group. Immutable values can't
+        # change before serialization, so a group of only those is stored as-is.
+        pickled = not self._config.defer_pickling and not all(
+            type(value) in _IMMUTABLE_VALUE_TYPES for value in args_to_store
+        )
+        if pickled:
+            serialized_values = [self._pickle_for_log(value) for value in args_to_store]
+        else:
+            serialized_values = list(args_to_store)
+
+        with self._lock:
+            log_index = self._log_index
             self._log_index += 1
 
-            # Append the group to the list for this call site
-            if call_site not in self._logs:
-                self._logs[call_site] = []
-            self._logs[call_site].append(log_group)
+            # Use the log index as the stack trace ID
+            stack_trace_id: Optional[int] = None
+            if stack_trace is not None:
+                stack_trace_id = log_index
+                self._stack_traces[stack_trace_id] = stack_trace
+
+            # Store the group with metadata including log index for total ordering
+            log_group = LogGroup(
+                values=serialized_values,
+                function_name=function_name,
+                arg_names=arg_names_to_store,
+                log_index=log_index,
+                class_name=class_name,
+                stack_trace_id=stack_trace_id,
+                name=log_name,
+                pickled=pickled,
+            )
+
+            # Append the group to the list for this call site
+            self._append_event(self._logs[call_site], log_group)
+
+        # Broadcast update in live mode
+        if self._live_mode_enabled:
+            self._broadcast_log_update(call_site, log_group, stack_trace_id)
+
+    def _new_events(self, events: Iterable[Any] = ()) -> Union[List[Any], Deque[Any]]:
+        """
+        Create a history list, bounded if max_events_per_call_site is set.
+
+        Args:
+            events: Initial contents
+
+        Returns:
+            A list, or a deque that keeps only the most recent events
+        """
+        max_events = self._config.max_events_per_call_site
+        if max_events is None:
+            return list(events)
+        return deque(events, maxlen=max_events)
+
+    def _new_histogram(self) -> HistogramSamples:
+        """Create a call site's histogram, bounded if max_events_per_call_site is set."""
+        return HistogramSamples(max_samples=self._config.max_events_per_call_site)
+
+    def _new_trace_references(self) -> TraceReferences:
+        """Create count()/happened() trace references, bounded like _new_histogram."""
+        return TraceReferences(max_items=self._config.max_events_per_call_site)
+
+    def _append_event(
+        self,
+        events: Union[List[Any], Deque[Any]],
+        event: Union[LogGroup, DashboardLog],
+    ):
+        """
+        Append to a call site's log or dashboard log history.
+
+        If the history is bounded and full, the oldest event is dropped along
+        with its stack trace (unless the trace belongs to another event, as
+        with the later samples of a hist_many() batch).
+
+        Args:
+            events: The call site's history
+            event: The new event
+        """
+        if isinstance(events, deque) and events and len(events) == events.maxlen:
+            evicted = events[0]
+            if evicted.stack_trace_id == evicted.log_index:
+                self._stack_traces.pop(evicted.stack_trace_id, None)
+        events.append(event)
+
+    def _pickle_for_log(self, value: Any) -> Union[bytes, str]:
+        """
+        Pickle a logged value, reusing the result for repeated large strings.
+
+        Only str and bytes are cached: they're immutable, so the pickle of a
+        given object never goes stale, and for large ones both the pickling
+        and the stored copy are worth sharing. Large pickles of other values
+        are shared when they're equal to a recently stored one.
+
+        Args:
+            value: The value to pickle
+
+        Returns:
+            The pickled bytes, or a "<PickleError: ...>" string if pickling fails
+        """
+        value_type = type(value)
+        if value_type is not str and value_type is not bytes:
+            return self._share_pickle(_pickle_value(value))
+        if len(value) < _PICKLE_CACHE_MIN_SIZE:
+            return _pickle_value(value)
+
+        key = id(value)
+        with self._pickle_cache_lock:
+            entry = self._pickle_cache.get(key)
+            if entry is not None:
+                self._pickle_cache.move_to_end(key)
+                return entry[1]
+
+        pickled = _pickle_value(value)
+        with self._pickle_cache_lock:
+            self._pickle_cache[key] = (value, pickled)
+            if len(self._pickle_cache) > _PICKLE_CACHE_CAPACITY:
+                self._pickle_cache.popitem(last=False)
+        return pickled
+
+    def _share_pickle(self, pickled: Union[bytes, str]) -> Union[bytes, str]:
+        """
+        Return a recently stored copy of a large pickle if one is equal to it.
+
+        Args:
+            pickled: Result of _pickle_value()
+
+        Returns:
+            The stored bytes equal to pickled, or pickled itself
+        """
+        if type(pickled) is not bytes or len(pickled) < _PICKLE_CACHE_MIN_SIZE:
+            return pickled
+
+        with self._pickle_cache_lock:
+            stored = self._pickle_store.get(pickled)
+            if stored is not None:
+                self._pickle_store.move_to_end(stored)
+                return stored
+            self._pickle_store[pickled] = pickled
+            if len(self._pickle_store) > _PICKLE_CACHE_CAPACITY:
+                self._pickle_store.popitem(last=False)
+        return pickled
+
+    def _store_stack_trace(self, stack_trace_id: int, call_stack_obj: CallStack):
+        """
+        Store the stack trace for an invocation.
+
+        With defer_stack_traces enabled, the CallStack itself is stored and the
+        trace is captured when it's first read (see _resolve_stack_trace).
+
+        Args:
+            stack_trace_id: ID to store the trace under
+            call_stack_obj: Call stack of the invocation
+        """
+        self._stack_traces[stack_trace_id] = self._stack_trace_to_store(call_stack_obj)
+
+    def _stack_trace_to_store(
+        self, call_stack_obj: CallStack
+    ) -> Union[StackTrace, CallStack]:
+        """
+        Capture the stack trace to store for an invocation.
+
+        Args:
+            call_stack_obj: Call stack of the invocation
+
+        Returns:
+            The captured StackTrace, or the CallStack itself if capture is deferred
+        """
+        if self._config.defer_stack_traces:
+            return call_stack_obj
+        return self._capture_stack_trace(call_stack_obj)
+
+    def _capture_stack_trace(self, call_stack_obj: CallStack) -> StackTrace:
+        """
+        Capture a call stack's trace with the configured detail.
+
+        Args:
+            call_stack_obj: Call stack of the invocation
+
+        Returns:
+            The captured StackTrace
+        """
+        return call_stack_obj.capture_stack_trace(
+            include_locals=self._config.include_locals,
+            max_frames=self._config.max_stack_frames,
+        )
+
+    def _resolve_stack_trace(self, stack_trace_id: int) -> Optional[StackTrace]:
+        """
+        Get a stored stack trace, capturing it first if it was deferred.
+
+        Args:
+            stack_trace_id: ID of the stack trace
+
+        Returns:
+            StackTrace if found, None otherwise
+        """
+        trace = self._stack_traces.get(stack_trace_id)
+        if isinstance(trace, CallStack):
+            trace = self._capture_stack_trace(trace)
+            self._stack_traces[stack_trace_id] = trace
+        return trace
+
+    def _resolve_deferred_stack_trace(
+        self, stack_trace_id: int, deferred: CallStack
+    ) -> StackTrace:
+        """
+        Capture a deferred stack trace without holding the report lock.
+
+        Args:
+            stack_trace_id: ID of the stack trace
+            deferred: The CallStack stored for it
+
+        Returns:
+            The captured StackTrace
+        """
+        trace = self._capture_stack_trace(deferred)
+        with self._lock:
+            # Only replace it if it wasn't dropped or replaced meanwhile
+            if self._stack_traces.get(stack_trace_id) is deferred:
+                self._stack_traces[stack_trace_id] = trace
+        return trace
+
+    @staticmethod
+    def _frame_names(frame: FrameType) -> Tuple[str, Optional[str]]:
+        """
+        Get the function name and class name (if it's a method) for a frame.
+
+        Args:
+            frame: The frame of the call site
 
-            # Broadcast update in live mode
-            if self._live_mode_enabled:
-                self._broadcast_log_update(call_site, log_group, stack_trace_id)
+        Returns:
+            Tuple of (function_name, class_name), class_name being None for non-methods
+        """
+        code = frame.f_code
+        class_name = None
+        # Reading f_locals copies a function's local variables into a dict,
+        # so only do it if the function has a "self" variable at all (module
+        # and class bodies keep theirs in a dict already)
+        if (
+            not code.co_flags & inspect.CO_NEWLOCALS
+            or "self" in code.co_varnames
+            or "self" in code.co_freevars
+        ):
+            self_obj = frame.f_locals.get("self")
+            if self_obj is not None:
+                class_name = type(self_obj).__name__
+        return code.co_name, class_name
 
     def _get_call_site_and_stack_trace(
         self,
@@ -472,29 +1181,11 @@ class Report:
             - function_name is the name of the function containing the call
             - class_name is the class name if it's a method, None otherwise
         """
-        # Get the call site (file path and line number) from the caller's frame
-        stack = inspect.stack()
-        # Skip frames from autopsy module itself
-        caller_frame = None
-        for frame_info in stack[1:]:  # Skip current frame
-            # Skip any frame from within the autopsy package
-            if not frame_info.filename.endswith(("autopsy/report.py", "autopsy/__init__.py")):
-                caller_frame = frame_info
-                break
-
-        if caller_frame is None:
-            # Fallback if we can't find a non-autopsy frame
-            caller_frame = stack[1]
-
-        call_site = (caller_frame.filename, caller_frame.lineno)
-
-        # Get function name and class name (if it's a method)
-        function_name = caller_frame.function
-        class_name = None
-        frame = caller_frame.frame
-        if "self" in frame.f_locals:
-            self_obj = frame.f_locals["self"]
-            class_name = type(self_obj).__name__
+        # Get the call site (file path and line number) from the caller's frame,
+        # skipping frames from autopsy itself
+        frame = self._caller_frame()
+        call_site = (frame.f_code.co_filename, frame.f_lineno)
+        function_name, class_name = self._frame_names(frame)
 
         # Note: Stack trace will be captured by the caller using the log_index
         # We return None here and let the caller capture it with the proper log_index
@@ -509,6 +1200,8 @@ class Report:
         Args:
             value: The value to count occurrences of
         """
+        if not self._config.enabled:
+            return
         self._ensure_initialized()
         with self._lock:
             call_site, _, function_name, class_name = (
@@ -522,55 +1215,64 @@ class Report:
             # Capture stack trace if auto_stack_trace is enabled
             stack_trace_id: Optional[int] = None
             if self._config.auto_stack_trace:
-                call_stack_obj = call_stack()
-                trace = call_stack_obj.capture_stack_trace()
                 # Use the log index as the stack trace ID
                 stack_trace_id = log_index
-                # Store the trace
-                self._stack_traces[stack_trace_id] = trace
+                self._store_stack_trace(stack_trace_id, call_stack())
 
             # Store dashboard log entry
-            if call_site not in self._dashboard_logs:
-                self._dashboard_logs[call_site] = []
-
-            dashboard_log = {
-                "log_index": log_index,
-                "dashboard_type": "count",
-                "function_name": function_name,
-                "value": value,
-            }
-            if class_name is not None:
-                dashboard_log["class_name"] = class_name
-            if stack_trace_id is not None:
-                dashboard_log["stack_trace_id"] = stack_trace_id
 
-            self._dashboard_logs[call_site].append(dashboard_log)
+            dashboard_log = DashboardLog(
+                log_index=log_index,
+                dashboard_type="count",
+                function_name=function_name,
+                class_name=class_name,
+                stack_trace_id=stack_trace_id,
+                value=value,
+            )
+
+            self._append_event(self._dashboard_logs[call_site], dashboard_log)
 
             # Broadcast update in live mode
             if self._live_mode_enabled:
                 self._broadcast_dashboard_update(call_site, dashboard_log)
 
-            if call_site not in self._counts:
-                self._counts[call_site] = {}
-                self._counts_metadata[call_site] = (function_name, class_name)
+            value_counts = self._counts[call_site]
+            if call_site not in self._counts_metadata:
+                self._counts_metadata[call_site] = _call_site_json(
+                    call_site, function_name, class_name
+                )
 
-            # For unhashable types, use JSON string representation as key
-            # This matches how we serialize in to_json()
-            try:
-                # Try to use value directly as dict key (works for hashable types)
-                hash(value)  # Test if hashable
+            # For unhashable types, key on the type and repr, which is much
+            # cheaper than converting the value to JSON on every call
+            if type(value) in _IMMUTABLE_VALUE_TYPES:
+                # Common scalars are always hashable
                 value_key = value
-            except TypeError:
-                # For unhashable types, use JSON string representation
-                json_value = to_json_serializable(value)
-                value_key = json.dumps(json_value, sort_keys=True, allow_nan=False)
+            else:
+                try:
+                    # Try to use value directly as dict key (works for hashable types)
+                    hash(value)  # Test if hashable
+                    value_key = value
+                except TypeError:
+                    value_key = _UnhashableCountKey(
+                        type(value).__name__, repr(value), json_value=""
+                    )
 
-            if value_key not in self._counts[call_site]:
-                self._counts[call_site][value_key] = []
+            trace_references = value_counts.get(value_key)
+            if trace_references is None:
+                if isinstance(value_key, _UnhashableCountKey):
+                    # Only the first occurrence of each value pays for JSON
+                    # conversion, which also snapshots it before any mutation
+                    json_value = dumps(to_json_serializable(value), sort_keys=True)
+                    value_key = _UnhashableCountKey(
+                        value_key.type_name, value_key.value_repr, json_value
+                    )
+                trace_references = value_counts[value_key] = (
+                    self._new_trace_references()
+                )
 
             # Append even if stack_trace_id is None (will be -1 or None in that case)
-            self._counts[call_site][value_key].append(
-                (stack_trace_id if stack_trace_id is not None else -1, log_index)
+            trace_references.append(
+                stack_trace_id if stack_trace_id is not None else -1, log_index
             )
 
     def hist(self, num: float):
@@ -578,8 +1280,11 @@ class Report:
         Collect a number from each invocation to produce a histogram.
 
         Args:
-            num: The number to add to the histogram
+            num: The number to add to the histogram. Values that can't be
+                converted to float are recorded but left out of the histogram.
         """
+        if not self._config.enabled:
+            return
         self._ensure_initialized()
         with self._lock:
             call_site, _, function_name, class_name = (
@@ -593,42 +1298,101 @@ class Report:
             # Capture stack trace if auto_stack_trace is enabled
             stack_trace_id: Optional[int] = None
             if self._config.auto_stack_trace:
-                call_stack_obj = call_stack()
-                trace = call_stack_obj.capture_stack_trace()
                 # Use the log index as the stack trace ID
                 stack_trace_id = log_index
-                # Store the trace
-                self._stack_traces[stack_trace_id] = trace
+                self._store_stack_trace(stack_trace_id, call_stack())
 
             # Store dashboard log entry
-            if call_site not in self._dashboard_logs:
-                self._dashboard_logs[call_site] = []
-
-            dashboard_log = {
-                "log_index": log_index,
-                "dashboard_type": "hist",
-                "function_name": function_name,
-                "value": num,
-            }
-            if class_name is not None:
-                dashboard_log["class_name"] = class_name
-            if stack_trace_id is not None:
-                dashboard_log["stack_trace_id"] = stack_trace_id
 
-            self._dashboard_logs[call_site].append(dashboard_log)
+            dashboard_log = DashboardLog(
+                log_index=log_index,
+                dashboard_type="hist",
+                function_name=function_name,
+                class_name=class_name,
+                stack_trace_id=stack_trace_id,
+                value=num,
+            )
+
+            self._append_event(self._dashboard_logs[call_site], dashboard_log)
 
             # Broadcast update in live mode
             if self._live_mode_enabled:
                 self._broadcast_dashboard_update(call_site, dashboard_log)
 
-            if call_site not in self._histograms:
-                self._histograms[call_site] = []
-                self._histograms_metadata[call_site] = (function_name, class_name)
+            if call_site not in self._histograms_metadata:
+                self._histograms_metadata[call_site] = _call_site_json(
+                    call_site, function_name, class_name
+                )
 
             self._histograms[call_site].append(
-                (num, stack_trace_id if stack_trace_id is not None else -1, log_index)
+                num, stack_trace_id if stack_trace_id is not None else -1, log_index
+            )
+
+    def hist_many(self, nums: Iterable[float]):
+        """
+        Collect a batch of numbers for a histogram in one call.
+
+        Equivalent to calling hist() for each number from this call site, but
+        the call site and stack trace are resolved once for the whole batch.
+        Every sample shares the stack trace stored under the batch's first
+        log index.
+
+        Args:
+            nums: The numbers to add to the histogram
+        """
+        if not self._config.enabled:
+            return
+        self._ensure_initialized()
+        nums = list(nums)
+        if not nums:
+            return
+
+        with self._lock:
+            call_site, _, function_name, class_name = (
+                self._get_call_site_and_stack_trace()
+            )
+
+            # Assign a log index to each sample
+            first_log_index = self._log_index
+            self._log_index += len(nums)
+
+            # Capture one stack trace for the batch if auto_stack_trace is enabled
+            stack_trace_id: Optional[int] = None
+            if self._config.auto_stack_trace:
+                stack_trace_id = first_log_index
+                self._store_stack_trace(stack_trace_id, call_stack())
+
+            if call_site not in self._histograms_metadata:
+                self._histograms_metadata[call_site] = _call_site_json(
+                    call_site, function_name, class_name
+                )
+
+            dashboard_logs = self._dashboard_logs[call_site]
+            batch = [
+                DashboardLog(
+                    log_index=log_index,
+                    dashboard_type="hist",
+                    function_name=function_name,
+                    class_name=class_name,
+                    stack_trace_id=stack_trace_id,
+                    value=num,
+                )
+                for log_index, num in enumerate(nums, first_log_index)
+            ]
+            for dashboard_log in batch:
+                self._append_event(dashboard_logs, dashboard_log)
+
+            self._histograms[call_site].extend(
+                nums,
+                stack_trace_id if stack_trace_id is not None else -1,
+                first_log_index,
             )
 
+        # Broadcast the batch in live mode, as one queued update built on the
+        # sender thread, after releasing the lock
+        if self._live_mode_enabled:
+            self._broadcast_dashboard_batch(call_site, batch)
+
     def timeline(self, event_name: str):
         """
         Record an event with a timestamp for timeline visualization.
@@ -636,10 +1400,10 @@ class Report:
         Args:
             event_name: Name of the event to record
         """
+        if not self._config.enabled:
+            return
         self._ensure_initialized()
         with self._lock:
-            import time
-
             call_site, _, function_name, class_name = (
                 self._get_call_site_and_stack_trace()
             )
@@ -651,46 +1415,32 @@ class Report:
             # Capture stack trace if auto_stack_trace is enabled
             stack_trace_id: Optional[int] = None
             if self._config.auto_stack_trace:
-                call_stack_obj = call_stack()
-                trace = call_stack_obj.capture_stack_trace()
                 # Use the log index as the stack trace ID
                 stack_trace_id = log_index
-                # Store the trace
-                self._stack_traces[stack_trace_id] = trace
+                self._store_stack_trace(stack_trace_id, call_stack())
 
             # Store dashboard log entry
-            if call_site not in self._dashboard_logs:
-                self._dashboard_logs[call_site] = []
 
             timestamp = time.time()
-            dashboard_log = {
-                "log_index": log_index,
-                "dashboard_type": "timeline",
-                "function_name": function_name,
-                "event_name": event_name,
-                "timestamp": timestamp,
-            }
-            if class_name is not None:
-                dashboard_log["class_name"] = class_name
-            if stack_trace_id is not None:
-                dashboard_log["stack_trace_id"] = stack_trace_id
+            dashboard_log = DashboardLog(
+                log_index=log_index,
+                dashboard_type="timeline",
+                function_name=function_name,
+                class_name=class_name,
+                stack_trace_id=stack_trace_id,
+                event_name=event_name,
+                timestamp=timestamp,
+            )
 
-            self._dashboard_logs[call_site].append(dashboard_log)
+            self._append_event(self._dashboard_logs[call_site], dashboard_log)
 
             # Broadcast update in live mode
             if self._live_mode_enabled:
                 self._broadcast_dashboard_update(call_site, dashboard_log)
 
-            event = {
-                "timestamp": timestamp,
-                "event_name": event_name,
-                "call_site": call_site,
-                "stack_trace_id": stack_trace_id,
-                "log_index": log_index,
-                "function_name": function_name,
-                "class_name": class_name,
-            }
-            self._timeline.append(event)
+            if self._timeline and timestamp < self._timeline[-1][1].timestamp:
+                self._timeline_in_order = False
+            self._timeline.append((call_site, dashboard_log))
 
     def happened(self, message: Optional[str] = None):
         """
@@ -699,11 +1449,28 @@ class Report:
         Args:
             message: Optional message to associate with this call site
         """
+        if not self._config.enabled:
+            return
         self._ensure_initialized()
+        frame = self._caller_frame()
+        call_site = (frame.f_code.co_filename, frame.f_lineno)
+        # Resolved per call, as the class can differ between calls (e.g. a
+        # method inherited by a subclass)
+        function_name, class_name = self._frame_names(frame)
         with self._lock:
-            call_site, _, function_name, class_name = (
-                self._get_call_site_and_stack_trace()
-            )
+            record = self._happened.get(call_site)
+            if record is None:
+                # The call site object keeps the names from the first call,
+                # like the other dashboard methods' call site metadata
+                record = _HappenedRecord(
+                    message,
+                    self._new_trace_references(),
+                    _call_site_json(call_site, function_name, class_name),
+                )
+                self._happened[call_site] = record
+            elif record.message is None:
+                # Use the first non-None message
+                record.message = message
 
             # Assign log index for this invocation
             log_index = self._log_index
@@ -712,48 +1479,40 @@ class Report:
             # Capture stack trace if auto_stack_trace is enabled
             stack_trace_id: Optional[int] = None
             if self._config.auto_stack_trace:
-                call_stack_obj = call_stack()
-                trace = call_stack_obj.capture_stack_trace()
                 # Use the log index as the stack trace ID
                 stack_trace_id = log_index
-                # Store the trace
-                self._stack_traces[stack_trace_id] = trace
+                self._store_stack_trace(stack_trace_id, call_stack())
+                record.trace_ids.append(stack_trace_id, log_index)
+            record.count += 1
 
             # Store dashboard log entry
-            if call_site not in self._dashboard_logs:
-                self._dashboard_logs[call_site] = []
-
-            dashboard_log = {
-                "log_index": log_index,
-                "dashboard_type": "happened",
-                "function_name": function_name,
-            }
-            if class_name is not None:
-                dashboard_log["class_name"] = class_name
-            if stack_trace_id is not None:
-                dashboard_log["stack_trace_id"] = stack_trace_id
-            if message is not None:
-                dashboard_log["message"] = message
+            dashboard_log = DashboardLog(
+                log_index=log_index,
+                dashboard_type="happened",
+                function_name=function_name,
+                class_name=class_name,
+                stack_trace_id=stack_trace_id,
+                message=message,
+            )
 
-            self._dashboard_logs[call_site].append(dashboard_log)
+            self._append_event(self._dashboard_logs[call_site], dashboard_log)
 
             # Broadcast update in live mode
             if self._live_mode_enabled:
                 self._broadcast_dashboard_update(call_site, dashboard_log)
 
-            if call_site not in self._happened:
-                self._happened[call_site] = (0, [], message)
-                self._happened_metadata[call_site] = (function_name, class_name)
-
-            count, stack_trace_ids, stored_message = self._happened[call_site]
-            # Update message if provided (use first non-None message)
-            if stored_message is None and message is not None:
-                stored_message = message
-
-            if stack_trace_id is not None:
-                stack_trace_ids.append((stack_trace_id, log_index))
-
-            self._happened[call_site] = (count + 1, stack_trace_ids, stored_message)
+    def _has_data(self) -> bool:
+        """Whether anything has been logged or recorded since the report was last cleared."""
+        return any(
+            (
+                self._logs,
+                self._dashboard_logs,
+                self._timeline,
+                self._happened,
+                self._counts,
+                self._histograms,
+            )
+        )
 
     def init(self, config: Optional[ReportConfiguration] = None, clear: bool = False, warn: bool = True):
         """
@@ -766,23 +1525,15 @@ class Report:
                   If False, suppresses warnings (useful for tests).
         """
         with self._lock:
-            # Check if there's any data that will be affected
-            has_data = (self._logs or self._dashboard_logs or self._timeline or
-                       self._happened or self._counts or self._histograms)
-
-            if warn and self._initialized and has_data:
+            # Warn if there's any data that will be affected (only checked
+            # when a warning could be printed)
+            if warn and self._initialized and self._has_data():
                 if clear:
                     # Warn if clearing data
-                    print(
-                        "Warning: Report.init() clearing existing data.",
-                        file=sys.stderr
-                    )
+                    sys.stderr.write(_WARN_CLEAR)
                 else:
                     # Warn if re-initializing with data (but not clearing)
-                    print(
-                        "Warning: Report.init() called on initialized report with existing data.",
-                        file=sys.stderr
-                    )
+                    sys.stderr.write(_WARN_REINIT)
 
             if clear:
                 # Clear all data
@@ -794,9 +1545,12 @@ class Report:
                 self._histograms.clear()
                 self._histograms_metadata.clear()
                 self._timeline.clear()
+                self._timeline_in_order = True
                 self._happened.clear()
-                self._happened_metadata.clear()
                 self._dashboard_logs.clear()
+                with self._pickle_cache_lock:
+                    self._pickle_cache.clear()
+                    self._pickle_store.clear()
                 # Reset written flag since we cleared data
                 self._written = False
 
@@ -809,6 +1563,9 @@ class Report:
             elif not self._initialized:
                 # Only reset to default if not initialized yet
                 self._config = ReportConfiguration()
+            # The timeline is the only history created up front; apply the
+            # new configuration's bound to it
+            self._timeline = self._new_events(self._timeline)
 
             # Environment variable takes precedence over code-specified mode
             env_mode = os.getenv("AUTOPSY_MODE", "").lower()
@@ -816,10 +1573,14 @@ class Report:
                 self._config.mode = env_mode
 
             # Start live server if enabled
-            if self._config.mode == "live" and not self._live_mode_enabled:
-                self._live_mode_enabled = True
+            if (
+                self._config.mode == "live"
+                and self._config.enabled
+                and not self._live_mode_enabled
+            ):
                 try:
                     from autopsy import live_server
+                    self._live_server = live_server
                     live_server.start_server(
                         self._config.live_mode_host,
                         self._config.live_mode_port
@@ -827,7 +1588,12 @@ class Report:
                 except Exception as e:
                     print(f"Warning: Failed to start live server: {type(e).__name__}: {e}")
                     print("Install dependencies with: uv pip install -e '.[live]'")
-                    self._live_mode_enabled = False
+                    self._live_server = None
+
+    @property
+    def _live_mode_enabled(self) -> bool:
+        """Whether live mode is enabled and its server was started."""
+        return self._live_server is not None
 
     def get_logs(self) -> Dict[Tuple[str, int], List[Dict[str, Any]]]:
         """
@@ -837,7 +1603,11 @@ class Report:
             Dictionary mapping call sites to lists of log groups.
             Each group is a dict with 'values', 'function_name', and 'arg_names'.
         """
-        return self._logs.copy()
+        with self._lock:
+            return {
+                call_site: [log_group.to_dict() for log_group in log_groups]
+                for call_site, log_groups in self._logs.items()
+            }
 
     def get_call_sites(self) -> List[Tuple[str, int]]:
         """
@@ -859,7 +1629,72 @@ class Report:
             StackTrace if found, None otherwise
         """
         # Stack trace ID is the same as log index
-        return self._stack_traces.get(log_index)
+        with self._lock:
+            return self._resolve_stack_trace(log_index)
+
+    @staticmethod
+    def _log_group_json_values(log_group: LogGroup) -> List[Dict[str, Any]]:
+        """
+        Unpickle and convert the values of one log() call to JSON-serializable form.
+
+        Args:
+            log_group: The log group to convert
+
+        Returns:
+            List of {"name": ..., "value": ...} dicts, "name" only present for named arguments
+        """
+        json_group = []
+        arg_names = log_group.arg_names
+
+        for idx, pickled_value in enumerate(log_group.values):
+            value_data = {}
+
+            # Add argument name if available
+            if idx < len(arg_names) and arg_names[idx] is not None:
+                value_data["name"] = arg_names[idx]
+
+            # Unpickle and convert value
+            if not log_group.pickled:
+                value_data["value"] = to_json_serializable(pickled_value)
+            elif isinstance(pickled_value, str) and pickled_value.startswith(
+                "<PickleError"
+            ):
+                value_data["value"] = pickled_value
+            elif isinstance(pickled_value, bytes):
+                try:
+                    # Unpickle the value
+                    unpickled = pickle.loads(pickled_value)
+                    # Try to convert to JSON-serializable format
+                    value_data["value"] = to_json_serializable(unpickled)
+                except Exception as e:
+                    # If unpickling fails, store error info
+                    value_data["value"] = f"<UnpickleError: {str(e)}>"
+            else:
+                # Not bytes, try to serialize directly
+                value_data["value"] = to_json_serializable(pickled_value)
+
+            json_group.append(value_data)
+
+        return json_group
+
+    @staticmethod
+    def _dashboard_call_site_json(
+        metadata: Dict[Tuple[str, int], Dict[str, Any]], call_site: Tuple[str, int]
+    ) -> Dict[str, Any]:
+        """
+        Get a copy of the stored "call_site" object for a count/hist call site.
+
+        Args:
+            metadata: _counts_metadata or _histograms_metadata
+            call_site: (filename, line_number) of the call site
+
+        Returns:
+            The call site's "call_site" object, copied so the snapshot can't modify it
+        """
+        call_site_json = metadata.get(call_site)
+        if call_site_json is None:
+            return _call_site_json(call_site, "<unknown>", None)
+        return dict(call_site_json)
 
     def to_json(self) -> Dict[str, Any]:
         """
@@ -870,378 +1705,369 @@ class Report:
             list of call site data. Each call site has 'filename', 'line', and 'value_groups' keys.
             Each value_group is a list of values from one log() call.
         """
+        # Copy what's needed under the lock, then convert it without holding
+        # the lock so that logging from other threads isn't blocked meanwhile.
+        # Stored events aren't modified once recorded, so shallow copies of
+        # the containers are enough.
         with self._lock:
-            call_sites = []
-
-            for call_site, log_groups in self._logs.items():
-                filename, line_number = call_site
-
-                # Process each group of values from a single log() call
-                json_value_groups = []
-                for log_group in log_groups:
-                    json_group = []
-                    pickled_values = log_group["values"]
-                    arg_names = log_group.get("arg_names", [])
-
-                    for idx, pickled_value in enumerate(pickled_values):
-                        value_data = {}
-
-                        # Add argument name if available
-                        if idx < len(arg_names) and arg_names[idx] is not None:
-                            value_data["name"] = arg_names[idx]
-
-                        # Unpickle and convert value
-                        if isinstance(pickled_value, str) and pickled_value.startswith(
-                            "<PickleError"
-                        ):
-                            value_data["value"] = pickled_value
-                        elif isinstance(pickled_value, bytes):
-                            try:
-                                # Unpickle the value
-                                unpickled = pickle.loads(pickled_value)
-                                # Try to convert to JSON-serializable format
-                                value_data["value"] = to_json_serializable(unpickled)
-                            except Exception as e:
-                                # If unpickling fails, store error info
-                                value_data["value"] = f"<UnpickleError: {str(e)}>"
-                        else:
-                            # Not bytes, try to serialize directly
-                            value_data["value"] = to_json_serializable(pickled_value)
-
-                        json_group.append(value_data)
-
-                    value_group_data = {
-                        "values": json_group,
-                        "function_name": log_group.get("function_name", "<unknown>"),
-                        "log_index": log_group.get("log_index", 0),
-                    }
-                    if "class_name" in log_group:
-                        value_group_data["class_name"] = log_group["class_name"]
-                    if "stack_trace_id" in log_group:
-                        # Convert to string to match stack_traces dictionary keys
-                        value_group_data["stack_trace_id"] = str(
-                            log_group["stack_trace_id"]
-                        )
-                    if "name" in log_group:
-                        value_group_data["name"] = log_group["name"]
-                    json_value_groups.append(value_group_data)
-
-                call_site_data = {
-                    "filename": filename,
-                    "line": line_number,
-                    "function_name": (
-                        log_groups[0].get("function_name", "<unknown>")
-                        if log_groups
-                        else "<unknown>"
-                    ),
-                    "value_groups": json_value_groups,
-                }
-                if log_groups and "class_name" in log_groups[0]:
-                    call_site_data["class_name"] = log_groups[0]["class_name"]
-                call_sites.append(call_site_data)
-
-            # Add dashboard call sites to call_sites list
-            for call_site, dashboard_logs in self._dashboard_logs.items():
-                filename, line_number = call_site
-
-                # Process each dashboard log entry
-                json_value_groups = []
-                for dashboard_log in dashboard_logs:
-                    dashboard_type = dashboard_log.get("dashboard_type", "unknown")
-
-                    # Create value group based on dashboard type
-                    value_group_data = {
-                        "log_index": dashboard_log.get("log_index", 0),
-                        "function_name": dashboard_log.get("function_name", "<unknown>"),
-                        "dashboard_type": dashboard_type,
-                    }
-                    if "class_name" in dashboard_log:
-                        value_group_data["class_name"] = dashboard_log["class_name"]
-                    if "stack_trace_id" in dashboard_log:
-                        value_group_data["stack_trace_id"] = str(
-                            dashboard_log["stack_trace_id"]
-                        )
-
-                    # Add type-specific data
-                    if dashboard_type in ("count", "hist"):
-                        value_group_data["value"] = to_json_serializable(
-                            dashboard_log.get("value")
-                        )
-                    elif dashboard_type == "timeline":
-                        value_group_data["event_name"] = dashboard_log.get("event_name")
-                        value_group_data["timestamp"] = dashboard_log.get("timestamp")
-                    elif dashboard_type == "happened":
-                        if "message" in dashboard_log:
-                            value_group_data["message"] = dashboard_log["message"]
-
-                    json_value_groups.append(value_group_data)
-
-                call_site_data = {
-                    "filename": filename,
-                    "line": line_number,
-                    "function_name": (
-                        dashboard_logs[0].get("function_name", "<unknown>")
-                        if dashboard_logs
-                        else "<unknown>"
-                    ),
-                    "value_groups": json_value_groups,
-                    "is_dashboard": True,
-                }
-                if dashboard_logs and "class_name" in dashboard_logs[0]:
-                    call_site_data["class_name"] = dashboard_logs[0]["class_name"]
-                call_sites.append(call_site_data)
-
-            # Convert stack traces to JSON-serializable format
-            json_stack_traces = {}
-            for trace_id, trace in self._stack_traces.items():
-                json_frames = []
-                for frame in trace.frames:
-                    json_frames.append(
-                        {
-                            "filename": frame.filename,
-                            "function_name": frame.function_name,
-                            "line_number": frame.line_number,
-                            "code_context": frame.code_context,
-                            "local_variables": frame.local_variables,
-                        }
-                    )
-                json_stack_traces[str(trace_id)] = {
-                    "frames": json_frames,
-                    "timestamp": trace.timestamp,
-                }
-
-            # Serialize dashboard data
-            dashboard_data = {}
-
-            # Serialize counts
-            json_counts = []
-            for call_site, value_counts in self._counts.items():
-                filename, line_number = call_site
-                # Get function name from stored metadata
-                function_name, class_name = self._counts_metadata.get(
-                    call_site, ("<unknown>", None)
+            logs = [(call_site, list(groups)) for call_site, groups in self._logs.items()]
+            dashboard_logs = [
+                (call_site, list(events))
+                for call_site, events in self._dashboard_logs.items()
+            ]
+            stack_traces = list(self._stack_traces.items())
+            counts = [
+                (
+                    call_site,
+                    [
+                        (value_key, refs.total, refs.columns())
+                        for value_key, refs in value_counts.items()
+                    ],
                 )
+                for call_site, value_counts in self._counts.items()
+            ]
+            counts_metadata = dict(self._counts_metadata)
+            histograms = [
+                (call_site, samples.columns())
+                for call_site, samples in self._histograms.items()
+            ]
+            histograms_metadata = dict(self._histograms_metadata)
+            timeline = list(self._timeline)
+            timeline_in_order = self._timeline_in_order
+            happened = [
+                (
+                    record.call_site_json,
+                    record.count,
+                    record.message,
+                    record.trace_ids.columns(),
+                )
+                for record in self._happened.values()
+            ]
+
+        call_sites = []
+        # String forms of the stored stack trace ids, which are referenced
+        # from many places below. Also used to drop references to traces
+        # that are no longer stored.
+        trace_id_strs = {trace_id: str(trace_id) for trace_id, _ in stack_traces}
+        # Bound once for the per-event loops below
+        trace_id_str = trace_id_strs.get
+        log_group_json_values = self._log_group_json_values
+
+        for call_site, log_groups in logs:
+            filename, line_number = call_site
 
-                # Convert value_counts to JSON-serializable format
-                json_value_counts = {}
-                for value_key, stack_trace_data in value_counts.items():
-                    # stack_trace_data is now a list of (stack_trace_id, log_index) tuples
-                    # Filter out -1 sentinel values (used when stack traces are disabled)
-                    stack_trace_ids = [str(st_id) for st_id, _ in stack_trace_data if st_id != -1]
-                    log_indices = [log_idx for _, log_idx in stack_trace_data]
-
-                    # value_key might already be a JSON string (for unhashable types)
-                    # or it might be the original value (for hashable types)
-                    # Check if it's already a valid JSON string by trying to parse it
-                    if isinstance(value_key, str):
-                        try:
-                            # Try to parse as JSON - if it succeeds, it's already a JSON string
-                            json.loads(value_key)
-                            # Already a JSON string, use it directly
-                            json_value_counts[value_key] = {
-                                "count": len(stack_trace_data),
-                                "stack_trace_ids": stack_trace_ids,
-                                "log_indices": log_indices,
-                            }
-                            continue
-                        except (json.JSONDecodeError, ValueError):
-                            # Not a JSON string, treat as regular string value
-                            pass
-
-                    # Convert value to JSON-serializable format
-                    json_value = to_json_serializable(value_key)
-                    json_value_counts[json.dumps(json_value, sort_keys=True, allow_nan=False)] = {
-                        "count": len(stack_trace_data),
-                        "stack_trace_ids": stack_trace_ids,
-                        "log_indices": log_indices,
-                    }
-
-                count_entry = {
-                    "call_site": {
-                        "filename": filename,
-                        "line": line_number,
-                        "function_name": function_name,
-                    },
-                    "value_counts": json_value_counts,
+            # Process each group of values from a single log() call
+            json_value_groups = []
+            for log_group in log_groups:
+                json_group = log_group.json_values
+                if json_group is None:
+                    json_group = log_group_json_values(log_group)
+                    # Deferred values are converted as they are at each
+                    # snapshot, so only pickled ones can be kept
+                    if log_group.pickled:
+                        log_group.json_values = json_group
+
+                value_group_data = {
+                    "values": json_group,
+                    "function_name": log_group.function_name,
+                    "log_index": log_group.log_index,
                 }
-                if class_name is not None:
-                    count_entry["call_site"]["class_name"] = class_name
-                json_counts.append(count_entry)
-
-            # Serialize histograms
-            json_histograms = []
-            for call_site, values in self._histograms.items():
-                filename, line_number = call_site
-                # Get function name from stored metadata
-                function_name, class_name = self._histograms_metadata.get(
-                    call_site, ("<unknown>", None)
-                )
+                if log_group.class_name is not None:
+                    value_group_data["class_name"] = log_group.class_name
+                if log_group.stack_trace_id is not None:
+                    # Convert to string to match stack_traces dictionary keys
+                    value_group_data["stack_trace_id"] = trace_id_str(
+                        log_group.stack_trace_id
+                    ) or str(log_group.stack_trace_id)
+                if log_group.name is not None:
+                    value_group_data["name"] = log_group.name
+                json_value_groups.append(value_group_data)
+
+            call_site_data = {
+                "filename": filename,
+                "line": line_number,
+                "function_name": (
+                    log_groups[0].function_name
+                    if log_groups
+                    else "<unknown>"
+                ),
+                "value_groups": json_value_groups,
+            }
+            if log_groups and log_groups[0].class_name is not None:
+                call_site_data["class_name"] = log_groups[0].class_name
+            call_sites.append(call_site_data)
 
-                json_values = []
-                for num, stack_trace_id, log_index in values:
-                    json_values.append(
-                        {
-                            "value": to_json_serializable(num),
-                            "stack_trace_id": (
-                                str(stack_trace_id) if stack_trace_id != -1 else None
-                            ),
-                            "log_index": log_index,
-                        }
-                    )
+        # Add dashboard call sites to call_sites list
+        for call_site, call_site_logs in dashboard_logs:
+            filename, line_number = call_site
 
-                hist_entry = {
-                    "call_site": {
-                        "filename": filename,
-                        "line": line_number,
-                        "function_name": function_name,
-                    },
-                    "values": json_values,
-                }
-                if class_name is not None:
-                    hist_entry["call_site"]["class_name"] = class_name
-                json_histograms.append(hist_entry)
-
-            # Serialize timeline (sort by timestamp)
-            json_timeline = []
-            sorted_timeline = sorted(self._timeline, key=lambda x: x["timestamp"])
-            for event in sorted_timeline:
-                call_site = event["call_site"]
-                filename, line_number = call_site
-                # Get function name from stored metadata in event
-                function_name = event.get("function_name", "<unknown>")
-                class_name = event.get("class_name")
-
-                timeline_entry = {
-                    "timestamp": event["timestamp"],
-                    "event_name": event["event_name"],
-                    "call_site": {
-                        "filename": filename,
-                        "line": line_number,
-                        "function_name": function_name,
-                    },
-                    "stack_trace_id": (
-                        str(event["stack_trace_id"])
-                        if event["stack_trace_id"] is not None
-                        else None
-                    ),
-                    "log_index": event.get("log_index"),
+            # Process each dashboard log entry
+            json_value_groups = []
+            for dashboard_log in call_site_logs:
+                dashboard_type = dashboard_log.dashboard_type
+
+                # Create value group based on dashboard type
+                value_group_data = {
+                    "log_index": dashboard_log.log_index,
+                    "function_name": dashboard_log.function_name,
+                    "dashboard_type": dashboard_type,
                 }
-                if class_name is not None:
-                    timeline_entry["call_site"]["class_name"] = class_name
-                json_timeline.append(timeline_entry)
-
-            # Serialize happened
-            json_happened = []
-            for call_site, (count, stack_trace_data, message) in self._happened.items():
-                filename, line_number = call_site
-                # Get function name from stored metadata
-                function_name, class_name = self._happened_metadata.get(
-                    call_site, ("<unknown>", None)
-                )
-                # stack_trace_data is now a list of (stack_trace_id, log_index) tuples
+                if dashboard_log.class_name is not None:
+                    value_group_data["class_name"] = dashboard_log.class_name
+                if dashboard_log.stack_trace_id is not None:
+                    value_group_data["stack_trace_id"] = trace_id_str(
+                        dashboard_log.stack_trace_id
+                    ) or str(dashboard_log.stack_trace_id)
+
+                # Add type-specific data
+                if dashboard_type in ("count", "hist"):
+                    value_group_data["value"] = to_json_serializable(
+                        dashboard_log.value
+                    )
+                elif dashboard_type == "timeline":
+                    value_group_data["event_name"] = dashboard_log.event_name
+                    value_group_data["timestamp"] = dashboard_log.timestamp
+                elif dashboard_type == "happened":
+                    if dashboard_log.message is not None:
+                        value_group_data["message"] = dashboard_log.message
+
+                json_value_groups.append(value_group_data)
+
+            call_site_data = {
+                "filename": filename,
+                "line": line_number,
+                "function_name": (
+                    call_site_logs[0].function_name
+                    if call_site_logs
+                    else "<unknown>"
+                ),
+                "value_groups": json_value_groups,
+                "is_dashboard": True,
+            }
+            if call_site_logs and call_site_logs[0].class_name is not None:
+                call_site_data["class_name"] = call_site_logs[0].class_name
+            call_sites.append(call_site_data)
+
+        # Convert stack traces to JSON-serializable format
+        json_stack_traces = {}
+        for trace_id, trace in stack_traces:
+            if isinstance(trace, CallStack):
+                trace = self._resolve_deferred_stack_trace(trace_id, trace)
+            # Built once per trace and shared with live updates and later snapshots
+            json_stack_traces[trace_id_strs[trace_id]] = trace.to_json()
+
+        # Serialize dashboard data
+        dashboard_data = {}
+
+        # Serialize counts
+        json_counts = []
+        for call_site, value_counts in counts:
+            # Convert value_counts to JSON-serializable format
+            json_value_counts = {}
+            for value_key, total, (st_ids, log_indices) in value_counts:
                 # Filter out -1 sentinel values (used when stack traces are disabled)
-                stack_trace_ids = [str(st_id) for st_id, _ in stack_trace_data if st_id != -1]
-                log_indices = [log_idx for _, log_idx in stack_trace_data]
-
-                happened_entry = {
-                    "call_site": {
-                        "filename": filename,
-                        "line": line_number,
-                        "function_name": function_name,
-                    },
-                    "count": count,
+                # and traces dropped from a bounded history
+                stack_trace_ids = [
+                    trace_id_strs[st_id] for st_id in st_ids if st_id in trace_id_strs
+                ]
+
+                # Unhashable values were converted to JSON when first counted
+                if isinstance(value_key, _UnhashableCountKey):
+                    json_key = value_key.json_value
+                elif type(value_key) in _SCALAR_TYPES:
+                    # JSON-safe as is: nothing to convert and no nested keys to sort
+                    json_key = dumps(value_key)
+                else:
+                    json_value = to_json_serializable(value_key)
+                    json_key = dumps(json_value, sort_keys=True)
+
+                # Values with different keys can have the same JSON form
+                # (e.g. a list and a tuple, or dicts in a different order)
+                existing = json_value_counts.get(json_key)
+                if existing is not None:
+                    existing["count"] += total
+                    existing["stack_trace_ids"].extend(stack_trace_ids)
+                    existing["log_indices"].extend(log_indices)
+                    continue
+
+                json_value_counts[json_key] = {
+                    # Every invocation, though only the most recent ones'
+                    # stack traces and log indices are kept
+                    "count": total,
                     "stack_trace_ids": stack_trace_ids,
                     "log_indices": log_indices,
                 }
-                if class_name is not None:
-                    happened_entry["call_site"]["class_name"] = class_name
-                if message is not None:
-                    happened_entry["message"] = message
-                json_happened.append(happened_entry)
-
-            # Only include dashboard if there's any data
-            if json_counts or json_histograms or json_timeline or json_happened:
-                dashboard_data = {
-                    "counts": json_counts,
-                    "histograms": json_histograms,
-                    "timeline": json_timeline,
-                    "happened": json_happened,
+
+            count_entry = {
+                "call_site": self._dashboard_call_site_json(
+                    counts_metadata, call_site
+                ),
+                "value_counts": json_value_counts,
+            }
+            json_counts.append(count_entry)
+
+        # Serialize histograms
+        json_histograms = []
+        for call_site, (values, stack_trace_ids, log_indices) in histograms:
+            # Each column was converted in bulk rather than sample by sample
+            json_values = [
+                {
+                    "value": (
+                        sanitize_float(num)
+                        if type(num) is float
+                        else to_json_serializable(num)
+                    ),
+                    "stack_trace_id": trace_id_str(stack_trace_id),
+                    "log_index": log_index,
                 }
+                for num, stack_trace_id, log_index in zip(
+                    values, stack_trace_ids, log_indices
+                )
+            ]
 
-            result = {
-                "generated_at": datetime.now().isoformat(),
-                "call_sites": call_sites,
-                "stack_traces": json_stack_traces,
+            hist_entry = {
+                "call_site": self._dashboard_call_site_json(
+                    histograms_metadata, call_site
+                ),
+                "values": json_values,
+            }
+            json_histograms.append(hist_entry)
+
+        # Serialize timeline (sort by timestamp). Events are appended as they
+        # happen, so this only needs sorting if the clock was adjusted.
+        json_timeline = []
+        sorted_timeline = timeline
+        if not timeline_in_order:
+            sorted_timeline = sorted(timeline, key=lambda x: x[1].timestamp)
+        for call_site, event in sorted_timeline:
+            filename, line_number = call_site
+
+            timeline_entry = {
+                "timestamp": event.timestamp,
+                "event_name": event.event_name,
+                "call_site": {
+                    "filename": filename,
+                    "line": line_number,
+                    "function_name": event.function_name,
+                },
+                "stack_trace_id": trace_id_str(event.stack_trace_id),
+                "log_index": event.log_index,
             }
+            if event.class_name is not None:
+                timeline_entry["call_site"]["class_name"] = event.class_name
+            json_timeline.append(timeline_entry)
+
+        # Serialize happened
+        json_happened = []
+        for call_site_json, count, message, (st_ids, log_indices) in happened:
+            # Filter out traces dropped from a bounded history
+            stack_trace_ids = [
+                trace_id_strs[st_id] for st_id in st_ids if st_id in trace_id_strs
+            ]
+
+            happened_entry = {
+                # Copied so the snapshot can't modify the stored object
+                "call_site": dict(call_site_json),
+                "count": count,
+                "stack_trace_ids": stack_trace_ids,
+                "log_indices": log_indices,
+            }
+            if message is not None:
+                happened_entry["message"] = message
+            json_happened.append(happened_entry)
+
+        # Only include dashboard if there's any data
+        if json_counts or json_histograms or json_timeline or json_happened:
+            dashboard_data = {
+                "counts": json_counts,
+                "histograms": json_histograms,
+                "timeline": json_timeline,
+                "happened": json_happened,
+            }
+
+        result = {
+            "generated_at": datetime.now().isoformat(),
+            "call_sites": call_sites,
+            "stack_traces": json_stack_traces,
+        }
 
-            if dashboard_data:
-                result["dashboard"] = dashboard_data
+        if dashboard_data:
+            result["dashboard"] = dashboard_data
 
-            # Add test results if available
-            try:
-                from autopsy.pytest import get_test_capture
-                test_capture = get_test_capture()
-                test_results = test_capture.get_results()
-                if test_results:
-                    result["tests"] = test_results
-            except (ImportError, Exception):
-                # pytest module not available or error getting test results
-                pass
+        # Add test results if available
+        try:
+            from autopsy.pytest import get_test_capture
+            test_capture = get_test_capture()
+            test_results = test_capture.get_results()
+            if test_results:
+                result["tests"] = test_results
+        except (ImportError, Exception):
+            # pytest module not available or error getting test results
+            pass
 
-            return result
+        return result
 
     def _broadcast_log_update(
-        self, call_site: Tuple[str, int], log_group: dict, stack_trace_id: Optional[int]
+        self, call_site: Tuple[str, int], log_group: LogGroup, stack_trace_id: Optional[int]
     ):
-        """Broadcast a log update to all WebSocket clients."""
-        if not self._live_mode_enabled:
+        """
+        Broadcast a log update to all WebSocket clients.
+
+        Only queues the update; it is built by _log_update on the live server's
+        sender thread, so the logging thread doesn't unpickle and convert values.
+        """
+        live_server = self._live_server
+        if live_server is None:
             return
 
         try:
-            from autopsy import live_server
-
-            filename, line = call_site
-
-            # Prepare value group for JSON serialization - must match to_json format
-            pickled_values = log_group.get("values", [])
-            arg_names = log_group.get("arg_names", [])
-            json_values = []
+            if not live_server.has_clients():
+                return
+            live_server.queue_broadcast(
+                partial(self._log_update, call_site, log_group, stack_trace_id)
+            )
+        except Exception as e:
+            # Silently fail if broadcast fails
+            print(f"Warning: Failed to broadcast log update: {e}")
 
-            # Build values array matching the snapshot format
-            for idx, pickled_value in enumerate(pickled_values):
-                value_data = {}
+    def _log_update(
+        self, call_site: Tuple[str, int], log_group: LogGroup, stack_trace_id: Optional[int]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Build the live update message for one log() call.
 
-                # Add argument name if available
-                if idx < len(arg_names) and arg_names[idx] is not None:
-                    value_data["name"] = arg_names[idx]
+        Args:
+            call_site: (filename, line_number) of the log() call
+            log_group: The logged values
+            stack_trace_id: ID of the call's stack trace, if any
 
-                # Deserialize and convert value
-                if isinstance(pickled_value, str) and pickled_value.startswith("<PickleError:"):
-                    value_data["value"] = pickled_value
-                elif isinstance(pickled_value, bytes):
-                    try:
-                        unpickled = pickle.loads(pickled_value)
-                        value_data["value"] = to_json_serializable(unpickled)
-                    except Exception as e:
-                        value_data["value"] = f"<UnpickleError: {str(e)}>"
-                else:
-                    value_data["value"] = to_json_serializable(pickled_value)
+        Returns:
+            The update, or None if it couldn't be built
+        """
+        try:
+            filename, line = call_site
 
-                json_values.append(value_data)
+            # Prepare value group for JSON serialization - must match to_json format,
+            # which reuses the converted values instead of building them again
+            json_values = self._log_group_json_values(log_group)
+            # Deferred values are converted as they are at each snapshot, so
+            # only pickled ones can be kept (as in to_json)
+            if log_group.pickled:
+                log_group.json_values = json_values
 
             # Build value_group matching the snapshot format
             value_group = {
                 "values": json_values,
-                "function_name": log_group.get("function_name", "<unknown>"),
-                "log_index": log_group.get("log_index", 0),
+                "function_name": log_group.function_name,
+                "log_index": log_group.log_index,
             }
 
-            if "class_name" in log_group:
-                value_group["class_name"] = log_group["class_name"]
-            if "stack_trace_id" in log_group:
-                value_group["stack_trace_id"] = str(log_group["stack_trace_id"])
-            if "name" in log_group:
-                value_group["name"] = log_group["name"]
+            if log_group.class_name is not None:
+                value_group["class_name"] = log_group.class_name
+            if log_group.stack_trace_id is not None:
+                value_group["stack_trace_id"] = str(log_group.stack_trace_id)
+            if log_group.name is not None:
+                value_group["name"] = log_group.name
 
             # Prepare incremental update
             update = {
@@ -1249,73 +2075,130 @@ class Report:
                 "call_site": {
                     "filename": filename,
                     "line": line,
-                    "function_name": log_group.get("function_name"),
-                    "class_name": log_group.get("class_name"),
+                    "function_name": log_group.function_name,
+                    "class_name": log_group.class_name,
                 },
                 "value_group": value_group,
             }
 
             # Add stack trace if present
-            if stack_trace_id is not None and stack_trace_id in self._stack_traces:
-                stack_trace = self._stack_traces[stack_trace_id]
-                update["stack_trace"] = {
-                    str(stack_trace_id): {
-                        "frames": [
-                            {
-                                "filename": frame.filename,
-                                "line_number": frame.line_number,
-                                "function_name": frame.function_name,
-                                "code_context": frame.code_context,
-                                "local_variables": frame.local_variables,
-                            }
-                            for frame in stack_trace.frames
-                        ],
-                        "timestamp": stack_trace.timestamp,
-                    }
-                }
-
-            # Queue broadcast
-            live_server.queue_broadcast(update)
+            self._add_update_stack_trace(update, stack_trace_id)
+            return update
         except Exception as e:
             # Silently fail if broadcast fails
             print(f"Warning: Failed to broadcast log update: {e}")
+            return None
 
     def _broadcast_dashboard_update(
-        self, call_site: Tuple[str, int], dashboard_log: dict
+        self, call_site: Tuple[str, int], dashboard_log: DashboardLog
     ):
-        """Broadcast a dashboard update (count/hist/timeline/happened) to all WebSocket clients."""
-        if not self._live_mode_enabled:
+        """
+        Broadcast a dashboard update (count/hist/timeline/happened) to all WebSocket clients.
+
+        Like _broadcast_log_update, the update is built on the sender thread.
+        """
+        live_server = self._live_server
+        if live_server is None:
             return
 
         try:
-            from autopsy import live_server
+            if not live_server.has_clients():
+                return
+            live_server.queue_broadcast(
+                partial(self._dashboard_update, call_site, dashboard_log)
+            )
+        except Exception as e:
+            # Silently fail if broadcast fails
+            print(f"Warning: Failed to broadcast dashboard update: {e}")
+
+    def _broadcast_dashboard_batch(
+        self, call_site: Tuple[str, int], dashboard_logs: List[DashboardLog]
+    ):
+        """
+        Broadcast the dashboard updates for a batch of invocations, like hist_many().
+
+        The batch is queued as a single entry, so a large one doesn't crowd
+        other updates out of the broadcast queue.
+        """
+        live_server = self._live_server
+        if live_server is None:
+            return
+
+        try:
+            if not live_server.has_clients():
+                return
+            live_server.queue_broadcast(
+                partial(self._dashboard_batch_updates, call_site, dashboard_logs)
+            )
+        except Exception as e:
+            # Silently fail if broadcast fails
+            print(f"Warning: Failed to broadcast dashboard update: {e}")
+
+    def _dashboard_batch_updates(
+        self, call_site: Tuple[str, int], dashboard_logs: List[DashboardLog]
+    ) -> List[Dict[str, Any]]:
+        """
+        Build the live update messages for a batch of invocations.
+
+        Args:
+            call_site: (filename, line_number) of the calls
+            dashboard_logs: The recorded invocations
+
+        Returns:
+            The updates that could be built. Only the first carries the stack
+            trace, which every invocation in a batch shares.
+        """
+        updates = []
+        for dashboard_log in dashboard_logs:
+            update = self._dashboard_update(
+                call_site, dashboard_log, include_stack_trace=not updates
+            )
+            if update is not None:
+                updates.append(update)
+        return updates
+
+    def _dashboard_update(
+        self,
+        call_site: Tuple[str, int],
+        dashboard_log: DashboardLog,
+        include_stack_trace: bool = True,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Build the live update message for one count/hist/timeline/happened call.
+
+        Args:
+            call_site: (filename, line_number) of the call
+            dashboard_log: The recorded invocation
+            include_stack_trace: Whether to add the invocation's stack trace
 
+        Returns:
+            The update, or None if it couldn't be built
+        """
+        try:
             filename, line = call_site
-            dashboard_type = dashboard_log.get("dashboard_type", "unknown")
+            dashboard_type = dashboard_log.dashboard_type
 
             # Build value_group matching the snapshot format for dashboard items
             value_group_data = {
-                "log_index": dashboard_log.get("log_index", 0),
-                "function_name": dashboard_log.get("function_name", "<unknown>"),
+                "log_index": dashboard_log.log_index,
+                "function_name": dashboard_log.function_name,
                 "dashboard_type": dashboard_type,
             }
 
-            if "class_name" in dashboard_log:
-                value_group_data["class_name"] = dashboard_log["class_name"]
-            if "stack_trace_id" in dashboard_log:
-                value_group_data["stack_trace_id"] = str(dashboard_log["stack_trace_id"])
+            if dashboard_log.class_name is not None:
+                value_group_data["class_name"] = dashboard_log.class_name
+            if dashboard_log.stack_trace_id is not None:
+                value_group_data["stack_trace_id"] = str(dashboard_log.stack_trace_id)
 
             # Add type-specific data
             if dashboard_type in ("count", "hist"):
-                value_group_data["value"] = to_json_serializable(
-                    dashboard_log.get("value")
-                )
+                value_group_data["value"] = to_json_serializable(dashboard_log.value)
             elif dashboard_type == "timeline":
-                value_group_data["event_name"] = dashboard_log.get("event_name")
-                value_group_data["timestamp"] = dashboard_log.get("timestamp")
+                value_group_data["event_name"] = dashboard_log.event_name
+                value_group_data["timestamp"] = dashboard_log.timestamp
             elif dashboard_type == "happened":
-                if "message" in dashboard_log:
-                    value_group_data["message"] = dashboard_log["message"]
+                if dashboard_log.message is not None:
+                    value_group_data["message"] = dashboard_log.message
 
             # Prepare incremental update
             update = {
@@ -1323,37 +2206,38 @@ class Report:
                 "call_site": {
                     "filename": filename,
                     "line": line,
-                    "function_name": dashboard_log.get("function_name"),
-                    "class_name": dashboard_log.get("class_name"),
+                    "function_name": dashboard_log.function_name,
+                    "class_name": dashboard_log.class_name,
                 },
                 "value_group": value_group_data,
             }
 
             # Add stack trace if present
-            stack_trace_id = dashboard_log.get("stack_trace_id")
-            if stack_trace_id is not None and stack_trace_id in self._stack_traces:
-                stack_trace = self._stack_traces[stack_trace_id]
-                update["stack_trace"] = {
-                    str(stack_trace_id): {
-                        "frames": [
-                            {
-                                "filename": frame.filename,
-                                "line_number": frame.line_number,
-                                "function_name": frame.function_name,
-                                "code_context": frame.code_context,
-                                "local_variables": frame.local_variables,
-                            }
-                            for frame in stack_trace.frames
-                        ],
-                        "timestamp": stack_trace.timestamp,
-                    }
-                }
-
-            # Queue broadcast
-            live_server.queue_broadcast(update)
+            if include_stack_trace:
+                self._add_update_stack_trace(update, dashboard_log.stack_trace_id)
+            return update
         except Exception as e:
             # Silently fail if broadcast fails
             print(f"Warning: Failed to broadcast dashboard update: {e}")
+            return None
+
+    def _add_update_stack_trace(
+        self, update: Dict[str, Any], stack_trace_id: Optional[int]
+    ):
+        """
+        Add a stack trace to a live update, if it's still stored.
+
+        Args:
+            update: The update message
+            stack_trace_id: ID of the stack trace, or None
+        """
+        if stack_trace_id is None:
+            return
+        stack_trace = self._stack_traces.get(stack_trace_id)
+        if isinstance(stack_trace, CallStack):
+            stack_trace = self._resolve_deferred_stack_trace(stack_trace_id, stack_trace)
+        if stack_trace is not None:
+            update["stack_trace"] = {str(stack_trace_id): stack_trace.to_json()}
 
 
 # Global singleton instance
@@ -1418,30 +2302,17 @@ def _atexit_handler():
         # In live mode, wait for logs to be transmitted to a client before exiting
         try:
             from autopsy import live_server
-            import time
 
             # Check if there's any data to transmit
-            has_data = (
-                _report_instance._logs
-                or _report_instance._dashboard_logs
-                or _report_instance._timeline
-                or _report_instance._happened
-            )
-
-            if has_data:
+            if _report_instance._has_data():
                 print("\n⏳ Waiting for client to connect and receive logs...", file=sys.stderr)
 
                 # Wait for logs to be transmitted (with timeout)
                 timeout = 300  # 5 minutes
-                start_time = time.time()
-                while not live_server.logs_transmitted():
-                    if time.time() - start_time > timeout:
-                        print("\n⚠️  Timeout: No client connected to receive logs.", file=sys.stderr)
-                        break
-                    time.sleep(0.1)
-
-                if live_server.logs_transmitted():
+                if live_server.wait_logs_transmitted(timeout):
                     print("✓ Logs transmitted to client successfully.", file=sys.stderr)
+                else:
+                    print("\n⚠️  Timeout: No client connected to receive logs.", file=sys.stderr)
         except Exception as e:
             print(f"\nWarning: Error waiting for client: {e}", file=sys.stderr)
 
@@ -1449,10 +2320,7 @@ def _atexit_handler():
         return
 
     # Check if there's any data to write
-    if (not _report_instance._logs and
-        not _report_instance._dashboard_logs and
-        not _report_instance._timeline and
-        not _report_instance._happened):
+    if not _report_instance._has_data():
         # No data collected, nothing to write
         return
 
@@ -1484,6 +2352,72 @@ def _atexit_handler():
 atexit.register(_atexit_handler)
 
 
+def _gzip_compress(data: bytes) -> bytes:
+    """
+    Compress data in gzip format, using ISA-L when it is installed.
+
+    Args:
+        data: Bytes to compress
+
+    Returns:
+        The gzip-compressed bytes
+    """
+    if igzip is not None:
+        return igzip.compress(data, compresslevel=_ISAL_GZIP_LEVEL)
+    return gzip.compress(data, compresslevel=_GZIP_LEVEL)
+
+
+def _base64_encode(data: bytes) -> bytes:
+    """
+    Base64-encode report data, with pybase64 if it's installed.
+
+    Args:
+        data: The bytes to encode
+
+    Returns:
+        The encoded bytes, without a trailing newline
+    """
+    if pybase64 is not None:
+        return pybase64.b64encode(data)
+    return binascii.b2a_base64(data, newline=False)
+
+
+def _load_template(template_path: Path) -> Tuple[str, str, bytes, bytes]:
+    """
+    Read the HTML template, reusing the last read while the file is unchanged.
+
+    The template is split around the content of its data tag, so the report
+    data only has to be concatenated in between.
+
+    Args:
+        template_path: Path to template.html
+
+    Returns:
+        (prefix, suffix, prefix_bytes, suffix_bytes): the template up to and
+        including the (compressed) opening data tag, and from its closing tag
+        on, as strings and UTF-8 encoded
+    """
+    global _TEMPLATE_CACHE
+
+    mtime_ns = template_path.stat().st_mtime_ns
+    cached = _TEMPLATE_CACHE
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    content = template_path.read_text(encoding="utf-8")
+    match = _AUTOPSY_DATA_RE.search(content)
+    if match is None:
+        raise ValueError(
+            f"No autopsy-data script tag found in the template at {template_path}."
+        )
+    prefix = content[: match.start()] + _COMPRESSED_DATA_TAG
+    suffix = match.group(3) + content[match.end() :]
+    # Encoded once here rather than each time a report is written
+    parts = (prefix, suffix, prefix.encode("utf-8"), suffix.encode("utf-8"))
+    _TEMPLATE_CACHE = (mtime_ns, parts)
+    return parts
+
+
 def generate_html(
     report: Optional[Report] = None, output_path: Optional[str] = None
 ) -> str:
@@ -1508,37 +2442,37 @@ def generate_html(
             "Make sure template.html exists in the autopsy package directory."
         )
 
-    template_content = template_path.read_text(encoding="utf-8")
+    template_prefix, template_suffix, prefix_bytes, suffix_bytes = _load_template(
+        template_path
+    )
 
     # Get JSON data from report
     report_data = report.to_json()
-    json_str = json.dumps(report_data, indent=2, allow_nan=False)
+    # Compact, since the data is only read by the viewer; indentation would
+    # just add bytes to encode, compress and embed
+    json_bytes = dumps_bytes(report_data)
 
     # Compress JSON data with gzip and encode as base64
-    json_bytes = json_str.encode("utf-8")
-    compressed_bytes = gzip.compress(json_bytes, compresslevel=9)
-    compressed_base64 = base64.b64encode(compressed_bytes).decode("ascii")
-
-    # Inject compressed JSON into the template
-    # Find and replace the content of the <script id="autopsy-data"> tag
-    # Change type to indicate compression
-    pattern = r'(<script id="autopsy-data" type="application/json">)(.*?)(</script>)'
-    replacement = (
-        r'<script id="autopsy-data" type="application/json" data-compressed="gzip">'
-        + compressed_base64
-        + r"</script>"
-    )
-    html_content = re.sub(pattern, replacement, template_content, flags=re.DOTALL)
+    compressed_bytes = _gzip_compress(json_bytes)
+    base64_bytes = _base64_encode(compressed_bytes)
 
     # Write to file if output_path is provided
     if output_path is not None:
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
-        output_file.write_text(html_content, encoding="utf-8")
+        # Written piece by piece from the already encoded template, with the
+        # data written as the base64 bytes it was encoded to
+        with open(output_file, "wb") as f:
+            f.write(prefix_bytes)
+            f.write(base64_bytes)
+            f.write(suffix_bytes)
         # Mark report as written
         report._written = True
 
-    return html_content
+    # Inject compressed JSON into the template as the content of the
+    # <script id="autopsy-data"> tag (marked as compressed by the prefix).
+    # Joined last, after the file (if any) has been written from the bytes.
+    return template_prefix + base64_bytes.decode("ascii") + template_suffix
 
 
 def generate_json(
@@ -1559,13 +2493,15 @@ def generate_json(
 
     # Get JSON data from report
     report_data = report.to_json()
-    json_str = json.dumps(report_data, indent=2, allow_nan=False)
+    # Encoded to bytes once, which are written as they are
+    json_bytes = dumps_bytes(report_data, indent=True)
+    json_str = json_bytes.decode("utf-8")
 
     # Write to file if output_path is provided
     if output_path is not None:
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
-        output_file.write_text(json_str, encoding="utf-8")
+        output_file.write_bytes(json_bytes)
         # Mark report as written
         report._written = True
 
@@ -1602,7 +2538,7 @@ def generate_text(
                     "filename": filename,
                     "line_number": line_number,
                     "log_group": log_group,
-                    "log_index": log_group.get("log_index", 0),
+                    "log_index": log_group.log_index,
                 })
 
         # Sort by log_index for chronological order
@@ -1616,14 +2552,14 @@ def generate_text(
 
             # Timestamp from stack trace if available
             timestamp_str = ""
-            stack_trace_id = log_group.get("stack_trace_id")
+            stack_trace_id = log_group.stack_trace_id
             if stack_trace_id is not None and stack_trace_id in report._stack_traces:
-                ts = report._stack_traces[stack_trace_id].timestamp
+                ts = report._resolve_stack_trace(stack_trace_id).timestamp
                 timestamp_str = datetime.fromtimestamp(ts).strftime("%H:%M:%S.%f")[:-3]
 
             # Code location
-            fn = log_group.get("function_name", "")
-            cls = log_group.get("class_name")
+            fn = log_group.function_name
+            cls = log_group.class_name
             loc_parts = [os.path.basename(filename), str(line_number)]
             if cls:
                 loc_parts.append(f"{cls}.{fn}")
@@ -1632,8 +2568,8 @@ def generate_text(
             location = ":".join(loc_parts)
 
             # Format values
-            name = log_group.get("name")
-            pickled_values = log_group["values"]
+            name = log_group.name
+            pickled_values = log_group.values
 
             value_parts: List[str] = []
             if name:
@@ -1641,10 +2577,12 @@ def generate_text(
 
             for idx, pickled_value in enumerate(pickled_values):
                 # Unpickle
-                if isinstance(pickled_value, str) and pickled_value.startswith("<PickleError"):
+                if not log_group.pickled:
+                    val = pickled_value
+                elif isinstance(pickled_value, str) and pickled_value.startswith("<PickleError"):
                     value_parts.append(pickled_value)
                     continue
-                if isinstance(pickled_value, bytes):
+                elif isinstance(pickled_value, bytes):
                     try:
                         val = pickle.loads(pickled_value)
                     except Exception as e:
@@ -10,7 +10,7 @@ export interface WebSocketConfig {
 }
 
 export interface IncrementalUpdate {
-  type: 'log' | 'count' | 'hist' | 'timeline' | 'happened' | 'snapshot' | 'test';
+  type: 'log' | 'count' | 'hist' | 'timeline' | 'happened' | 'snapshot' | 'test' | 'test_batch' | 'batch';
   call_site?: {
     filename: string;
     line: number;
@@ -21,6 +21,8 @@ export interface IncrementalUpdate {
   stack_trace?: Record<string, StackTrace>;
   data?: AutopsyData;
   test?: any;
+  results?: any[];
+  updates?: IncrementalUpdate[];
 }
 
 export function createWebSocketConnection(config: WebSocketConfig): WebSocket {
@@ -84,8 +86,12 @@ export function createWebSocketConnection(config: WebSocketConfig): WebSocket {
       }
       config.onSnapshot(message.data);
     } else {
-      // Batch incremental updates
-      updateBatch.push(message);
+      // Batch incremental updates; the server may already have grouped several
+      if (message.type === 'batch' && message.updates) {
+        updateBatch.push(...message.updates);
+      } else {
+        updateBatch.push(message);
+      }
 
       // Flush immediately if batch is full, otherwise schedule a flush
       if (updateBatch.length >= MAX_BATCH_SIZE) {
@@ -149,6 +155,8 @@ export function mergeIncrementalUpdate(
 
   if (update.type === 'test' && update.test) {
     updated.tests = [...(current.tests || []), update.test];
+  } else if (update.type === 'test_batch' && update.results) {
+    updated.tests = [...(current.tests || []), ...update.results];
   }
 
   if (update.stack_trace) {
@@ -136,3 +136,25 @@ def test_multiline_with_complex_args():
     # Should be multi-line
     lines = code_context.split('\n')
     assert len(lines) > 1
+
+
+def test_code_context_shared_across_traces():
+    """Test that traces through the same line share the code context string."""
+    traces = []
+    for _ in range(2):
+        traces.append(autopsy.call_stack().capture_stack_trace())
+
+    first, second = (trace.frames[0] for trace in traces)
+    assert first.function_name == 'test_code_context_shared_across_traces'
+    assert 'autopsy.call_stack()' in first.code_context
+    assert first.code_context is second.code_context
+
+
+def test_stack_trace_json_built_once():
+    """Test that a captured trace's JSON form is built once and reused."""
+    trace = autopsy.call_stack().capture_stack_trace()
+
+    json_trace = trace.to_json()
+    assert json_trace["timestamp"] == trace.timestamp
+    assert json_trace["frames"][0]["function_name"] == 'test_stack_trace_json_built_once'
+    assert trace.to_json() is json_trace
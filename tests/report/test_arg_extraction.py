@@ -1,5 +1,6 @@
 """Test argument expression extraction from report.log() calls."""
 
+import os
 import tempfile
 from pathlib import Path
 
@@ -252,3 +253,59 @@ def test_func():
         assert arg_names == []
     finally:
         Path(temp_file).unlink()
+
+
+def test_extraction_refreshes_when_file_changes():
+    """Test that cached arg names are refreshed after the source file is edited."""
+    report.init()
+
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
+        f.write(
+            """
+def test_func():
+    report.log(x, y)
+"""
+        )
+        temp_file = f.name
+
+    try:
+        assert report._extract_arg_names(temp_file, 3) == ["x", "y"]
+        # Repeated lookups come from the cache
+        assert report._extract_arg_names(temp_file, 3) == ["x", "y"]
+
+        Path(temp_file).write_text(
+            """
+def test_func():
+    report.log(a, b, c)
+"""
+        )
+        # Force a distinct modification time regardless of filesystem resolution
+        stat = os.stat(temp_file)
+        os.utime(temp_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert report._extract_arg_names(temp_file, 3) == ["a", "b", "c"]
+    finally:
+        Path(temp_file).unlink()
+
+
+def test_extract_call_inside_larger_expression():
+    """Test extraction when the call's line doesn't start its statement."""
+    report.init()
+
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
+        f.write(
+            """
+def test_func():
+    results = combine(
+        first,
+        report.log(a, b.c),
+    )
+"""
+        )
+        temp_file = f.name
+
+    try:
+        arg_names = report._extract_arg_names(temp_file, 5)
+        assert arg_names == ["a", "b.c"], f"Expected ['a', 'b.c'], got {arg_names}"
+    finally:
+        Path(temp_file).unlink()
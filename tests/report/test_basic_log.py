@@ -55,3 +55,114 @@ def test_multiple_calls_same_site():
     # Verify values - each group should have one value
     values = [pickle.loads(group["values"][0]) for group in value_groups]
     assert values == [0, 1, 2, 3, 4], f"Expected [0,1,2,3,4], got {values}"
+
+
+def test_get_logs_omits_unset_fields():
+    """Test that log groups returned by get_logs() only include fields that are set."""
+    report.init()
+
+    report.log(1)
+
+    (group,) = next(iter(report.get_logs().values()))
+    assert set(group) == {
+        "values",
+        "function_name",
+        "arg_names",
+        "log_index",
+        "stack_trace_id",
+    }
+
+
+def test_repeated_large_string_shares_pickle():
+    """Test that logging the same large string reuses its pickled bytes."""
+    report.init()
+
+    # Logged alongside a mutable value, so that the group is pickled
+    text = "x" * 10_000
+    for _ in range(3):
+        report.log(text, [])
+
+    (groups,) = report.get_logs().values()
+    first, second, third = (group["values"][0] for group in groups)
+    assert first is second is third
+    assert pickle.loads(first) == text
+
+
+def test_equal_values_share_pickle():
+    """Test that logging equal large objects stores their pickled bytes once."""
+    report.init(clear=True)
+
+    for _ in range(2):
+        config = {"layers": list(range(200)), "name": "model"}
+        report.log(config)
+
+    (groups,) = report._logs.values()
+    first, second = (group.values[0] for group in groups)
+    assert first is second
+    assert pickle.loads(first) == config
+
+
+def test_immutable_values_stored_unpickled():
+    """Test that a group of immutable values is stored as-is but still reported pickled."""
+    report.init(clear=True)
+
+    text = "x" * 10_000
+    report.log(1, 2.5, text, None)
+
+    (groups,) = report._logs.values()
+    assert not groups[0].pickled
+    assert groups[0].values[2] is text
+
+    (groups,) = report.get_logs().values()
+    assert [pickle.loads(value) for value in groups[0]["values"]] == [1, 2.5, text, None]
+
+
+def test_repeated_to_json_includes_new_logs():
+    """Test that values converted by one snapshot are reused by the next."""
+    report.init(clear=True)
+
+    def log_value(x):
+        report.log(x)
+
+    log_value([1, 2])
+    first = report.to_json()
+    log_value([3, 4])
+    second = report.to_json()
+
+    first_groups = first["call_sites"][0]["value_groups"]
+    second_groups = second["call_sites"][0]["value_groups"]
+    assert len(first_groups) == 1
+    assert [group["values"][0]["value"] for group in second_groups] == [[1, 2], [3, 4]]
+    assert second_groups[0]["values"] is first_groups[0]["values"]
+
+
+def test_generate_html_embeds_report_data():
+    """Test that the report data embedded in the HTML decodes back to the report."""
+    import base64
+    import gzip
+    import json
+    import re
+
+    from autopsy import generate_html
+
+    report.init(clear=True)
+    greeting = "héllo"
+    report.log(greeting)
+
+    html = generate_html(report)
+    match = re.search(r'data-compressed="gzip">(.*?)</script>', html, re.DOTALL)
+    data = json.loads(gzip.decompress(base64.b64decode(match.group(1))))
+    value_group = data["call_sites"][0]["value_groups"][0]
+    assert value_group["values"][0]["value"] == "héllo"
+
+
+def test_generate_html_file_matches_return_value(tmp_path):
+    """Test that the HTML written from the encoded template matches the returned string."""
+    from autopsy import generate_html
+
+    report.init(clear=True)
+    report.log("héllo")
+
+    output_path = tmp_path / "report.html"
+    html = generate_html(report, str(output_path))
+    assert output_path.read_text(encoding="utf-8") == html
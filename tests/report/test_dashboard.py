@@ -3,7 +3,7 @@
 import json
 import time
 
-from autopsy import report
+from autopsy import Report, ReportConfiguration, report
 
 
 def test_count_basic():
@@ -187,6 +187,22 @@ def test_timeline_basic():
         assert event["stack_trace_id"] is not None
 
 
+def test_timeline_clock_goes_backwards(monkeypatch):
+    """Test that timeline events are still sorted if the clock is adjusted."""
+    # No stack traces, so that timeline() is the only caller of time.time()
+    test_report = Report(ReportConfiguration(auto_stack_trace=False))
+
+    timestamps = iter([100.0, 50.0, 75.0])
+    monkeypatch.setattr(time, "time", lambda: next(timestamps))
+    test_report.timeline("first")
+    test_report.timeline("second")
+    test_report.timeline("third")
+    monkeypatch.undo()
+
+    timeline = test_report.to_json()["dashboard"]["timeline"]
+    assert [e["event_name"] for e in timeline] == ["second", "third", "first"]
+
+
 def test_timeline_multiple_call_sites():
     """Test timeline events from different call sites."""
     report.init()
@@ -255,6 +271,41 @@ def test_happened_with_message():
     assert happened_entry["message"] == "test message"
 
 
+def test_happened_message_after_first_call():
+    """Test that a message is kept even if the first call had none."""
+    report.init()
+
+    def count_with_message(msg=None):
+        report.happened(msg)
+
+    count_with_message()
+    count_with_message("later message")
+    count_with_message()
+
+    data = report.to_json()
+    happened_entry = data["dashboard"]["happened"][0]
+    assert happened_entry["count"] == 3
+    assert happened_entry["message"] == "later message"
+
+
+def test_happened_class_name_per_call():
+    """Test that each happened() event records the class of its own call."""
+    r = Report(ReportConfiguration(auto_stack_trace=False))
+
+    class A:
+        def f(self):
+            r.happened()
+
+    class B(A):
+        pass
+
+    A().f()
+    B().f()
+
+    (call_site,) = r.to_json()["call_sites"]
+    assert [group["class_name"] for group in call_site["value_groups"]] == ["A", "B"]
+
+
 def test_happened_multiple_call_sites():
     """Test invocation counting from different call sites."""
     report.init()
@@ -431,3 +482,157 @@ def test_count_with_complex_values():
     assert found_dict, (
         "Should find at least one dict value in counts - verifies unhashable values work"
     )
+
+
+def test_hist_non_numeric_value():
+    """Test that non-numeric hist values are kept in the histogram as they were given."""
+    report.init()
+
+    def collect(value):
+        report.hist(value)
+
+    collect(1)
+    collect("not a number")
+    collect(2.5)
+
+    data = report.to_json()
+    (hist_entry,) = data["dashboard"]["histograms"]
+    assert [v["value"] for v in hist_entry["values"]] == [1, "not a number", 2.5]
+
+    (call_site,) = [cs for cs in data["call_sites"] if cs.get("is_dashboard")]
+    assert len(call_site["value_groups"]) == 3
+
+
+def test_hist_int_values_stay_ints():
+    """Test that int samples are given back as ints, not as the floats they're stored as."""
+    r = Report(ReportConfiguration(auto_stack_trace=False))
+
+    def collect(value):
+        r.hist(value)
+
+    collect(3)
+    collect(2.0)
+    collect(2**60)
+    collect(True)
+
+    (hist_entry,) = r.to_json()["dashboard"]["histograms"]
+    values = [v["value"] for v in hist_entry["values"]]
+    assert values == [3, 2.0, 2**60, True]
+    assert [type(value) for value in values] == [int, float, int, bool]
+
+
+class _Seconds(float):
+    """A float subclass, like numpy.float64."""
+
+
+def test_hist_float_subclass_values():
+    """Test that float subclass samples are stored in the typed values column."""
+    r = Report(ReportConfiguration(auto_stack_trace=False))
+
+    def collect(value):
+        r.hist(value)
+
+    collect(_Seconds(1.5))
+    collect(_Seconds(2.5))
+
+    (samples,) = r._histograms.values()
+    assert samples.values.tolist() == [1.5, 2.5]
+    assert samples.other_values == {}
+
+    (hist_entry,) = r.to_json()["dashboard"]["histograms"]
+    assert [v["value"] for v in hist_entry["values"]] == [1.5, 2.5]
+
+
+def test_count_unhashable_values():
+    """Test counting unhashable values, which are snapshotted when first counted."""
+    report.init()
+
+    def count_value(value):
+        report.count(value)
+
+    items = [1, 2]
+    count_value(items)
+    count_value([1, 2])
+    items.append(3)
+    count_value(items)
+    count_value("[1, 2]")
+
+    data = report.to_json()
+    (count_entry,) = data["dashboard"]["counts"]
+    counts = {
+        json.dumps(json.loads(key)): value_data["count"]
+        for key, value_data in count_entry["value_counts"].items()
+    }
+    assert counts == {"[1, 2]": 2, "[1, 2, 3]": 1, '"[1, 2]"': 1}
+
+
+def test_hist_many():
+    """Test that a batch of samples matches the equivalent hist() calls."""
+    r = Report()
+
+    r.hist_many([1.5, 2.0, 3.5])
+
+    data = r.to_json()
+    (hist_entry,) = data["dashboard"]["histograms"]
+    values = hist_entry["values"]
+    assert [v["value"] for v in values] == [1.5, 2.0, 3.5]
+    assert [v["log_index"] for v in values] == [0, 1, 2]
+
+    # The batch shares one stack trace
+    (stack_trace_id,) = {v["stack_trace_id"] for v in values}
+    assert stack_trace_id in data["stack_traces"]
+
+    (call_site,) = data["call_sites"]
+    assert len(call_site["value_groups"]) == 3
+
+
+def test_hist_many_keeps_non_floats():
+    """Test that a batch with values other than numbers keeps them as they were given."""
+    r = Report(ReportConfiguration(auto_stack_trace=False))
+
+    r.hist_many([1, "2.5", "x", None, 3.0])
+
+    data = r.to_json()
+    (hist_entry,) = data["dashboard"]["histograms"]
+    values = hist_entry["values"]
+    assert [v["value"] for v in values] == [1, "2.5", "x", None, 3.0]
+    assert [v["log_index"] for v in values] == [0, 1, 2, 3, 4]
+
+
+
+def test_hist_many_bulk_columns():
+    """Test that batches of real numbers are stored in the typed columns in bulk."""
+    r = Report(ReportConfiguration(auto_stack_trace=False))
+
+    def collect(values):
+        r.hist_many(values)
+
+    collect([_Seconds(1.5), _Seconds(2.5)])
+    collect([1, 2])
+    collect([0.5, 4])
+    collect([3.5, 2**60])
+
+    (samples,) = r._histograms.values()
+    assert samples.values.tolist()[:7] == [1.5, 2.5, 1.0, 2.0, 0.5, 4.0, 3.5]
+    assert samples.int_flags.tolist() == [0, 0, 1, 1, 0, 1, 0, 0]
+    assert samples.other_values == {7: 2**60}
+
+    (hist_entry,) = r.to_json()["dashboard"]["histograms"]
+    values = [v["value"] for v in hist_entry["values"]]
+    assert values == [1.5, 2.5, 1, 2, 0.5, 4, 3.5, 2**60]
+    assert [type(value) for value in values] == [
+        float, float, int, int, float, int, float, int
+    ]
+
+def test_count_keys_are_compact_json():
+    """Test that count keys are encoded compactly, like the live view's JSON.stringify."""
+    report.init(clear=True)
+
+    def count_value(value):
+        report.count(value)
+
+    count_value([1, 2])
+    count_value({"b": 1, "a": "é"})
+
+    value_counts = report.to_json()["dashboard"]["counts"][0]["value_counts"]
+    assert set(value_counts) == {'[1,2]', '{"a":"é","b":1}'}
@@ -0,0 +1,139 @@
+"""Test the incremental updates queued for live mode clients."""
+
+import logging
+import queue
+import threading
+
+from autopsy import Report, ReportConfiguration, live_server
+
+
+def test_updates_built_on_sender_thread(monkeypatch):
+    """Test that updates are queued unbuilt and match the snapshot format once built."""
+    queued = []
+    monkeypatch.setattr(live_server, "queue_broadcast", queued.append)
+    monkeypatch.setattr(live_server, "has_clients", lambda: True)
+    r = Report()
+    r._live_server = live_server
+
+    def log_and_count(value):
+        r.log(value)
+        r.count(value)
+
+    log_and_count([1, 2])
+
+    # Nothing has been converted on the logging thread yet
+    assert all(callable(update) for update in queued)
+
+    log_update, count_update = live_server._build_updates(queued)
+    assert log_update["type"] == "log"
+    assert log_update["value_group"]["values"] == [{"value": [1, 2]}]
+    stack_trace_id = log_update["value_group"]["stack_trace_id"]
+    assert list(log_update["stack_trace"]) == [stack_trace_id]
+
+    assert count_update["type"] == "count"
+    assert count_update["value_group"]["value"] == [1, 2]
+
+
+def test_hist_many_queues_one_update(monkeypatch):
+    """Test that a hist_many() batch is queued as one entry building every sample's update."""
+    queued = []
+    monkeypatch.setattr(live_server, "queue_broadcast", queued.append)
+    monkeypatch.setattr(live_server, "has_clients", lambda: True)
+    r = Report()
+    r._live_server = live_server
+
+    r.hist_many([1.0, 2.0, 3.0])
+
+    (batch,) = queued
+    updates = live_server._build_updates([batch])
+    assert [update["value_group"]["value"] for update in updates] == [1.0, 2.0, 3.0]
+    # The shared stack trace is only sent once
+    assert ["stack_trace" in update for update in updates] == [True, False, False]
+
+
+def test_deferred_values_not_frozen_by_updates(monkeypatch):
+    """Test that building a live update doesn't freeze deferred values for to_json."""
+    queued = []
+    monkeypatch.setattr(live_server, "queue_broadcast", queued.append)
+    monkeypatch.setattr(live_server, "has_clients", lambda: True)
+    r = Report(ReportConfiguration(auto_stack_trace=False, defer_pickling=True))
+    r._live_server = live_server
+
+    def log_value(value):
+        r.log(value)
+
+    d = {"a": 1}
+    log_value(d)
+
+    (log_update,) = live_server._build_updates(queued)
+    assert log_update["value_group"]["values"] == [{"value": {"a": 1}}]
+
+    d["a"] = 2
+    (call_site,) = r.to_json()["call_sites"]
+    assert call_site["value_groups"][0]["values"] == [{"value": {"a": 2}}]
+
+
+def test_no_updates_without_clients(monkeypatch):
+    """Test that nothing is queued while no client is connected."""
+    queued = []
+    monkeypatch.setattr(live_server, "queue_broadcast", queued.append)
+    r = Report()
+    r._live_server = live_server
+
+    r.log(1)
+    r.happened()
+
+    assert queued == []
+
+
+def test_dropped_updates_counted_across_threads(monkeypatch, caplog):
+    """Test that updates dropped by concurrent producers are all counted and warned about once."""
+
+    class RunningLoop:
+        def is_running(self):
+            return True
+
+    monkeypatch.setattr(live_server, "_loop", RunningLoop())
+    monkeypatch.setattr(live_server, "_broadcast_queue", queue.Queue(maxsize=1))
+    monkeypatch.setattr(live_server, "_dropped_updates", 0)
+    monkeypatch.setattr(live_server, "_warned_dropped_updates", False)
+
+    def produce():
+        for i in range(1000):
+            live_server.queue_broadcast({"type": "test", "i": i})
+
+    with caplog.at_level(logging.WARNING, logger=live_server.__name__):
+        threads = [threading.Thread(target=produce) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert live_server.dropped_updates() == 4 * 1000 - 1
+    assert len(caplog.records) == 1
+
+
+def test_test_results_flushed_after_interval(monkeypatch):
+    """Test that pending test results are sent once the batch interval passes, without another test finishing."""
+    import autopsy.pytest as autopsy_pytest
+
+    queued = queue.Queue()
+    monkeypatch.setattr(live_server, "queue_broadcast", queued.put)
+    r = Report(ReportConfiguration(auto_stack_trace=False))
+    r._live_server = live_server
+    monkeypatch.setattr(autopsy_pytest, "get_report", lambda: r)
+
+    class Item:
+        nodeid = "tests/test_example.py::test_one"
+        name = "test_one"
+        path = "tests/test_example.py"
+        location = ("tests/test_example.py", 1, "test_one")
+
+    capture = autopsy_pytest.AutopsyTestCapture()
+    capture.start_test(Item.nodeid)
+    capture.finish_test(Item(), "passed")
+
+    update = queued.get(timeout=5)
+    assert update["type"] == "test_batch"
+    assert [result["nodeid"] for result in update["results"]] == [Item.nodeid]
+    assert capture._flush_timer is None
@@ -1,9 +1,11 @@
 """Test log ordering in various scenarios: loops, recursion, and async code."""
 
 import asyncio
+import pickle
+import threading
 from typing import Any, Dict, List, Tuple
 
-from autopsy import report
+from autopsy import Report, ReportConfiguration, report
 
 
 def get_logs_in_order() -> List[Tuple[int, Tuple[str, int], Dict[str, Any]]]:
@@ -211,3 +213,29 @@ def test_mixed_scenario():
     # Verify indices are sequential
     for i, (log_index, call_site, group) in enumerate(all_groups):
         assert log_index == i, f"Expected log_index {i}, got {log_index}"
+
+
+def test_concurrent_logging():
+    """Test that logs from concurrent threads get unique, gap-free indices."""
+    r = Report(ReportConfiguration(auto_stack_trace=False))
+
+    def worker(thread_id: int):
+        for i in range(50):
+            r.log(thread_id, i)
+
+    threads = [threading.Thread(target=worker, args=(t,)) for t in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    (log_groups,) = r.get_logs().values()
+    log_indices = sorted(group["log_index"] for group in log_groups)
+    assert log_indices == list(range(200))
+
+    # Each thread's logs keep their relative order
+    by_thread: Dict[int, List[int]] = {}
+    for group in sorted(log_groups, key=lambda g: g["log_index"]):
+        thread_id, i = (pickle.loads(v) for v in group["values"])
+        by_thread.setdefault(thread_id, []).append(i)
+    assert by_thread == {t: list(range(50)) for t in range(4)}
@@ -0,0 +1,155 @@
+"""Test ReportConfiguration options that trade detail for logging speed."""
+
+import pickle
+
+from autopsy import Report, ReportConfiguration
+
+
+def test_capture_arg_names_disabled():
+    """Test that disabling arg name capture stores no names and infers no name."""
+    r = Report(ReportConfiguration(capture_arg_names=False))
+
+    x = 1
+    r.log("label", x)
+
+    (log_groups,) = r.get_logs().values()
+    group = log_groups[0]
+    assert group["arg_names"] == [None, None]
+    assert "name" not in group
+    assert len(group["values"]) == 2
+
+
+def test_defer_stack_traces():
+    """Test that deferred stack traces are captured when the report is read."""
+    r = Report(ReportConfiguration(defer_stack_traces=True))
+
+    def helper():
+        y = 42
+        r.log(y)
+
+    helper()
+
+    data = r.to_json()
+    (call_site,) = data["call_sites"]
+    stack_trace_id = call_site["value_groups"][0]["stack_trace_id"]
+    frames = data["stack_traces"][stack_trace_id]["frames"]
+    assert frames[0]["function_name"] == "helper"
+    assert frames[0]["local_variables"]["y"] == 42
+    assert r.get_stack_trace(int(stack_trace_id)) is not None
+
+
+def test_defer_pickling():
+    """Test that deferred values are serialized when the report is read."""
+    r = Report(ReportConfiguration(defer_pickling=True))
+
+    items = [1, 2]
+    r.log(items, lambda: None)
+
+    (call_site,) = r.to_json()["call_sites"]
+    values = call_site["value_groups"][0]["values"]
+    assert values[0]["value"] == [1, 2]
+
+    (log_groups,) = r.get_logs().values()
+    assert pickle.loads(log_groups[0]["values"][0]) == [1, 2]
+    assert log_groups[0]["values"][1].startswith("<PickleError")
+    assert "pickled" not in log_groups[0]
+
+
+def test_max_events_per_call_site():
+    """Test that bounded history keeps the latest events and drops old traces."""
+    r = Report(ReportConfiguration(max_events_per_call_site=3))
+
+    for i in range(10):
+        r.log(i)
+        r.hist(i)
+        r.count(i % 2)
+
+    data = r.to_json()
+    log_site, hist_site, count_site = data["call_sites"]
+    log_indices = [group["log_index"] for group in log_site["value_groups"]]
+    assert [group["values"][0]["value"] for group in log_site["value_groups"]] == [
+        7,
+        8,
+        9,
+    ]
+    assert len(hist_site["value_groups"]) == 3
+    assert len(count_site["value_groups"]) == 3
+
+    (hist_entry,) = data["dashboard"]["histograms"]
+    assert [v["value"] for v in hist_entry["values"]] == [7.0, 8.0, 9.0]
+
+    # Only the stack traces of kept events remain
+    assert len(data["stack_traces"]) == 9
+    assert all(str(i) in data["stack_traces"] for i in log_indices)
+
+
+def test_max_events_per_call_site_counts():
+    """Test that count() totals include invocations whose references were dropped."""
+    r = Report(ReportConfiguration(max_events_per_call_site=3))
+
+    for i in range(10):
+        r.count(i % 2)
+        r.happened()
+
+    dashboard = r.to_json()["dashboard"]
+    (count_entry,) = dashboard["counts"]
+    (happened_entry,) = dashboard["happened"]
+    value_counts = count_entry["value_counts"]
+    assert {key: value["count"] for key, value in value_counts.items()} == {
+        "0": 5,
+        "1": 5,
+    }
+    assert [len(value["log_indices"]) for value in value_counts.values()] == [3, 3]
+    assert happened_entry["count"] == 10
+
+
+def test_disabled():
+    """Test that a disabled report records nothing."""
+    r = Report(ReportConfiguration(enabled=False))
+
+    x = 1
+    r.log(x)
+    r.count(x)
+    r.hist(1.5)
+    r.hist_many([1.0, 2.0])
+    r.timeline("event")
+    r.happened()
+
+    assert not r._has_data()
+    assert r._log_index == 0
+
+
+def test_stack_trace_detail():
+    """Test that stack traces can leave out local variables and outer frames."""
+    r = Report(ReportConfiguration(include_locals=False, max_stack_frames=1))
+
+    def helper():
+        y = 42
+        r.log(y)
+
+    helper()
+
+    data = r.to_json()
+    (call_site,) = data["call_sites"]
+    stack_trace_id = call_site["value_groups"][0]["stack_trace_id"]
+    (frame,) = data["stack_traces"][stack_trace_id]["frames"]
+    assert frame["function_name"] == "helper"
+    assert frame["local_variables"] == {}
+
+
+def test_init_warnings(capsys):
+    """Test that re-initializing a report with data warns on stderr unless told not to."""
+    r = Report()
+    r.init()
+    r.log(1)
+
+    r.init()
+    assert capsys.readouterr().err == (
+        "Warning: Report.init() called on initialized report with existing data.\n"
+    )
+    r.init(clear=True)
+    assert capsys.readouterr().err == "Warning: Report.init() clearing existing data.\n"
+
+    r.log(1)
+    r.init(clear=True, warn=False)
+    assert capsys.readouterr().err == ""
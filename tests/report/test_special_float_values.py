@@ -2,6 +2,8 @@
 
 import json
 
+import pytest
+
 from autopsy.report import Report, ReportConfiguration
 
 
@@ -154,3 +156,47 @@ def test_to_json_serializable():
     # Verify all results are JSON serializable with allow_nan=False
     json.dumps(to_json_serializable(float('inf')), allow_nan=False)
     json.dumps(to_json_serializable([float('inf'), float('nan')]), allow_nan=False)
+
+
+def test_to_json_serializable_other_types():
+    """Test that types json can't encode fall back to their repr."""
+    from autopsy.json_utils import to_json_serializable
+
+    class Point:
+        def __repr__(self):
+            return "Point()"
+
+    assert to_json_serializable(Point()) == "<Point: Point()>"
+    assert to_json_serializable({1, 2}) == "<set: {1, 2}>"
+    assert to_json_serializable([Point(), 1]) == ["<Point: Point()>", 1]
+
+
+def test_to_json_serializable_deep_and_circular():
+    """Test that deeply nested and self-containing values are converted."""
+    from autopsy.json_utils import to_json_serializable
+
+    deep = [float('inf')]
+    for _ in range(5000):
+        deep = [deep]
+    result = to_json_serializable(deep)
+    for _ in range(5000):
+        result = result[0]
+    assert result == ['Infinity']
+
+    circular = {'a': 1}
+    circular['self'] = circular
+    assert to_json_serializable(circular) == {
+        'a': 1,
+        'self': '<dict: (circular reference)>',
+    }
+
+
+def test_stdlib_dumps_rejects_nan():
+    """Test that the standard library fallback fails on unsanitized NaN and Infinity."""
+    from autopsy.json_utils import _stdlib_dumps
+
+    for value in (float('nan'), [float('inf')]):
+        with pytest.raises(ValueError):
+            _stdlib_dumps(value, sort_keys=False, indent=False)
+        with pytest.raises(ValueError):
+            _stdlib_dumps(value, sort_keys=False, indent=True)